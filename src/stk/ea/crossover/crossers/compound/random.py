@@ -7,6 +7,8 @@ Random Crosser
 
 import numpy as np
 
+from ....utilities import _get_cumulative_weights
+
 
 class RandomCrosser:
     """
@@ -178,8 +180,22 @@ class RandomCrosser:
 
         """
 
-        self._crossers = crossers
-        self._weights = weights
+        # The methods are bound once here, which also means that an
+        # object without a :meth:`.cross` method is caught
+        # immediately, rather than when it first gets picked.
+        self._cross_methods = tuple(
+            crosser.cross for crosser in crossers
+        )
+        # The cumulative distribution is computed, and the weights
+        # validated, once here, so that picking a crosser only needs a
+        # single random number and a binary search.
+        if weights is None:
+            self._cumulative_weights = None
+        else:
+            self._cumulative_weights = _get_cumulative_weights(
+                weights=weights,
+                num_items=len(self._cross_methods),
+            )
         self._generator = np.random.RandomState(random_seed)
 
     def cross(self, records):
@@ -199,8 +215,11 @@ class RandomCrosser:
 
         """
 
-        crosser = self._generator.choice(
-            a=self._crossers,
-            p=self._weights,
-        )
-        return crosser.cross(records)
+        if self._cumulative_weights is None:
+            index = self._generator.randint(len(self._cross_methods))
+        else:
+            index = self._cumulative_weights.searchsorted(
+                self._generator.random_sample(),
+                side="right",
+            )
+        return self._cross_methods[index](records)
@@ -210,25 +210,26 @@ class GeneticRecombination(MoleculeCrosser):
         self._name = name
 
     def cross(self, records):
-        topology_graphs = (
+        topology_graphs = tuple(
             record.get_topology_graph() for record in records
         )
+        # Maps each building block to its gene, so that the gene of
+        # a building block is only calculated once per crossover.
+        genes = {}
+        for topology_graph in topology_graphs:
+            for building_block in topology_graph.get_building_blocks():
+                if building_block not in genes:
+                    genes[building_block] = self._get_gene(
+                        building_block
+                    )
+
         for topology_graph, alleles in it.product(
             topology_graphs,
-            self._get_alleles(records),
+            self._get_alleles(topology_graphs, genes),
         ):
-
-            def get_replacement(building_block):
-                gene = self._get_gene(building_block)
-                return next(
-                    allele
-                    for allele in alleles
-                    if self._get_gene(allele) == gene
-                )
-
             topology_graph = topology_graph.with_building_blocks(
                 building_block_map={
-                    building_block: get_replacement(building_block)
+                    building_block: alleles[genes[building_block]]
                     for building_block in topology_graph.get_building_blocks()
                 },
             )
@@ -239,17 +240,31 @@ class GeneticRecombination(MoleculeCrosser):
                 crosser_name=self._name,
             )
 
-    def _get_alleles(self, records):
+    def _get_alleles(self, topology_graphs, genes):
         """
         Yield every possible combination of alleles.
 
+        Parameters
+        ----------
+        topology_graphs : :class:`tuple` of :class:`.TopologyGraph`
+            The topology graphs of the molecules being crossed.
+
+        genes : :class:`dict`
+            Maps every building block in `topology_graphs` to its
+            gene.
+
+        Yields
+        ------
+        :class:`dict`
+            Maps every gene to the allele used for it in a
+            combination.
+
         """
 
-        genes = defaultdict(list)
-        topology_graphs = (
-            record.get_topology_graph() for record in records
-        )
+        alleles = defaultdict(list)
         for topology_graph in topology_graphs:
             for allele in topology_graph.get_building_blocks():
-                genes[self._get_gene(allele)].append(allele)
-        return it.product(*genes.values())
+                alleles[genes[allele]].append(allele)
+
+        for combination in it.product(*alleles.values()):
+            yield dict(zip(alleles.keys(), combination))
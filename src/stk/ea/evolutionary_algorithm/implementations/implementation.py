@@ -5,6 +5,7 @@ Evolutionary Algorithm Implementation
 """
 
 import itertools as it
+import weakref
 
 from stk.utilities import dedupe
 
@@ -50,8 +51,19 @@ class Implementation:
         def get_mutation_record(batch):
             return self._mutator.mutate(batch[0])
 
+        # Maps molecules to their keys, so that the keys of molecules
+        # which survive into the next generation are not recalculated
+        # when the next generation is deduplicated.
+        keys = weakref.WeakKeyDictionary()
+
         def get_key(record):
-            return self._key_maker.get_key(record.get_molecule())
+            molecule = record.get_molecule()
+            key = keys.get(molecule)
+            if key is None:
+                key = keys[molecule] = self._key_maker.get_key(
+                    molecule
+                )
+            return key
 
         population = self._initial_population
 
@@ -74,6 +86,11 @@ class Implementation:
             self._logger.info(f"Starting generation {generation}.")
             self._logger.info(f"Population size is {len(population)}.")
 
+            # Crossovers and mutations are not passed to map_, because
+            # crossers and mutators hold random number generators.
+            # Copies sent to worker processes would never advance the
+            # state of the originals, so every generation would repeat
+            # the same random choices.
             self._logger.info("Doing crossovers.")
             crossover_records = tuple(
                 self._get_crossover_records(population)
@@ -7,6 +7,8 @@ Random Mutator
 
 import numpy as np
 
+from ....utilities import _get_cumulative_weights
+
 
 class RandomMutator:
     """
@@ -125,8 +127,22 @@ class RandomMutator:
 
         """
 
-        self._mutators = mutators
-        self._weights = weights
+        # The methods are bound once here, which also means that an
+        # object without a :meth:`.mutate` method is caught
+        # immediately, rather than when it first gets picked.
+        self._mutate_methods = tuple(
+            mutator.mutate for mutator in mutators
+        )
+        # The cumulative distribution is computed, and the weights
+        # validated, once here, so that picking a mutator only needs a
+        # single random number and a binary search.
+        if weights is None:
+            self._cumulative_weights = None
+        else:
+            self._cumulative_weights = _get_cumulative_weights(
+                weights=weights,
+                num_items=len(self._mutate_methods),
+            )
         self._generator = np.random.RandomState(random_seed)
 
     def mutate(self, record):
@@ -150,8 +166,11 @@ class RandomMutator:
 
         """
 
-        mutator = self._generator.choice(
-            a=self._mutators,
-            p=self._weights,
-        )
-        return mutator.mutate(record)
+        if self._cumulative_weights is None:
+            index = self._generator.randint(len(self._mutate_methods))
+        else:
+            index = self._cumulative_weights.searchsorted(
+                self._generator.random_sample(),
+                side="right",
+            )
+        return self._mutate_methods[index](record)
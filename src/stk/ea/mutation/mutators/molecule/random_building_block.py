@@ -9,6 +9,7 @@ import numpy as np
 from ....molecule_records import MoleculeRecord
 from ...records import MutationRecord
 from .mutator import MoleculeMutator
+from .utilities import _ReplaceableBuildingBlocks
 
 
 class RandomBuildingBlock(MoleculeMutator):
@@ -99,24 +100,30 @@ class RandomBuildingBlock(MoleculeMutator):
 
         """
 
-        self._building_blocks = building_blocks
-        self._is_replaceable = is_replaceable
+        # Stored as a tuple, so that a replacement can be picked by
+        # index, rather than having the generator convert every
+        # building block into an array each time mutate() is called.
+        self._building_blocks = tuple(building_blocks)
         self._name = name
         self._generator = np.random.RandomState(random_seed)
+        self._replaceable_building_blocks = _ReplaceableBuildingBlocks(
+            is_replaceable=is_replaceable,
+        )
 
     def mutate(self, record):
         # Choose the building block which undergoes mutation.
-        replaceable_building_blocks = tuple(
-            filter(
-                self._is_replaceable,
-                record.get_molecule().get_building_blocks(),
+        replaceable_building_blocks = (
+            self._replaceable_building_blocks.get(
+                record.get_molecule()
             )
         )
-        replaced_building_block = self._generator.choice(
-            a=replaceable_building_blocks,
-        )
+        replaced_building_block = replaceable_building_blocks[
+            self._generator.randint(len(replaceable_building_blocks))
+        ]
         # Choose a replacement building block.
-        replacement = self._generator.choice(self._building_blocks)
+        replacement = self._building_blocks[
+            self._generator.randint(len(self._building_blocks))
+        ]
 
         # Build the new ConstructedMolecule.
         graph = record.get_topology_graph().with_building_blocks(
@@ -78,14 +78,17 @@ class RandomTopologyGraph(MoleculeMutator):
 
         """
 
-        self._replacement_funcs = replacement_funcs
+        # Stored as a tuple so that a function can be picked by index,
+        # rather than by having RandomState.choice() convert the
+        # functions into an array on every mutation.
+        self._replacement_funcs = tuple(replacement_funcs)
         self._name = name
         self._generator = np.random.RandomState(random_seed)
 
     def mutate(self, record):
-        replacement_func = self._generator.choice(
-            a=self._replacement_funcs,
-        )
+        replacement_func = self._replacement_funcs[
+            self._generator.randint(len(self._replacement_funcs))
+        ]
         replacement = replacement_func(record.get_topology_graph())
         return MutationRecord(
             molecule_record=MoleculeRecord(replacement),
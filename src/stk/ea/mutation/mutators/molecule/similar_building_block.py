@@ -14,6 +14,7 @@ from stk.utilities import dice_similarity
 from ....molecule_records import MoleculeRecord
 from ...records import MutationRecord
 from .mutator import MoleculeMutator
+from .utilities import _ReplaceableBuildingBlocks
 
 
 class SimilarBuildingBlock(MoleculeMutator):
@@ -112,40 +113,44 @@ class SimilarBuildingBlock(MoleculeMutator):
         """
 
         self._building_blocks = building_blocks
-        self._is_replaceable = is_replaceable
         self._key_maker = key_maker
         self._name = name
         self._generator = np.random.RandomState(random_seed)
+        self._replaceable_building_blocks = _ReplaceableBuildingBlocks(
+            is_replaceable=is_replaceable,
+        )
         self._similar_building_blocks = {}
+        # Maps the key of a replaced building block to
+        # `building_blocks`, sorted by similarity to it.
+        self._similarity_orderings = {}
 
     def mutate(self, record):
         key = self._key_maker.get_key(record.get_molecule())
         if key not in self._similar_building_blocks:
-            # Maps the key to a dict. The dict maps each
-            # building block to an iterator.
-            # The iterators yield the next most similar molecules in
-            # `building_blocks` to the building block.
+            # Maps the key to a dict. The dict maps the key of each
+            # replaced building block to the position of the next
+            # most similar molecule in its similarity ordering.
             self._similar_building_blocks[key] = {}
 
         similar_building_blocks = self._similar_building_blocks[key]
 
         # Choose the building block which undergoes mutation.
-        replaceable_building_blocks = tuple(
-            filter(
-                self._is_replaceable,
-                record.get_molecule().get_building_blocks(),
+        replaceable_building_blocks = (
+            self._replaceable_building_blocks.get(
+                record.get_molecule()
             )
         )
-        replaced_building_block = self._generator.choice(
-            a=replaceable_building_blocks,
-        )
+        replaced_building_block = replaceable_building_blocks[
+            self._generator.randint(len(replaceable_building_blocks))
+        ]
 
-        # If the building block has not been chosen before, create an
-        # iterator yielding similar molecules from `building_blocks`
-        # for it.
+        # If the building block has not been chosen before, sort
+        # `building_blocks` by similarity to it. The ordering is
+        # shared by every molecule holding the building block.
         replaced_key = self._key_maker.get_key(replaced_building_block)
-        if replaced_key not in similar_building_blocks:
-            similar_building_blocks[replaced_key] = iter(
+        similar = self._similarity_orderings.get(replaced_key)
+        if similar is None:
+            similar = self._similarity_orderings[replaced_key] = tuple(
                 sorted(
                     self._building_blocks,
                     key=partial(
@@ -155,41 +160,19 @@ class SimilarBuildingBlock(MoleculeMutator):
                 )
             )
 
-        try:
-            replacement = next(similar_building_blocks[replaced_key])
-        except StopIteration:
-            similar_building_blocks[replaced_key] = iter(
-                sorted(
-                    self._building_blocks,
-                    key=partial(
-                        dice_similarity, replaced_building_block
-                    ),
-                    reverse=True,
-                )
-            )
-            replacement = next(similar_building_blocks[replaced_key])
+        # Once the least similar molecule has been used, start again
+        # from the most similar one.
+        cursor = similar_building_blocks.get(replaced_key, 0)
+        replacement = similar[cursor]
+        cursor = (cursor + 1) % len(similar)
 
         # If the most similar molecule in `building_blocks` is itself,
         # then take the next most similar one.
         if self._key_maker.get_key(replacement) == replaced_key:
-            try:
-                replacement = next(
-                    similar_building_blocks[replaced_key]
-                )
-            except StopIteration:
-                similar_building_blocks[replaced_key] = iter(
-                    sorted(
-                        self._building_blocks,
-                        key=partial(
-                            dice_similarity,
-                            replaced_building_block,
-                        ),
-                        reverse=True,
-                    )
-                )
-                replacement = next(
-                    similar_building_blocks[replaced_key]
-                )
+            replacement = similar[cursor]
+            cursor = (cursor + 1) % len(similar)
+
+        similar_building_blocks[replaced_key] = cursor
 
         # Build the new ConstructedMolecule.
         graph = record.get_topology_graph().with_building_blocks(
@@ -0,0 +1,64 @@
+"""
+Molecule Mutator Utilities
+==========================
+
+"""
+
+import weakref
+
+
+class _ReplaceableBuildingBlocks:
+    """
+    Finds the building blocks of molecules which can be replaced.
+
+    The result for each molecule is cached, so that repeated
+    mutations of the same molecule do not re-apply `is_replaceable`.
+    An entry is dropped when its molecule is garbage collected.
+
+    """
+
+    __slots__ = ["_is_replaceable", "_replaceable_building_blocks"]
+
+    def __init__(self, is_replaceable):
+        """
+        Initialize a :class:`._ReplaceableBuildingBlocks` instance.
+
+        Parameters
+        ----------
+        is_replaceable : :class:`callable`
+            A function which takes a :class:`.BuildingBlock` and
+            returns ``True`` or ``False``, depending on whether the
+            building block can be replaced.
+
+        """
+
+        self._is_replaceable = is_replaceable
+        self._replaceable_building_blocks = weakref.WeakKeyDictionary()
+
+    def get(self, molecule):
+        """
+        Get the building blocks of `molecule` which can be replaced.
+
+        Parameters
+        ----------
+        molecule : :class:`.ConstructedMolecule`
+            The molecule being mutated.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.BuildingBlock`
+            The building blocks of `molecule` for which
+            `is_replaceable` returned ``True``.
+
+        """
+
+        replaceable = self._replaceable_building_blocks.get(molecule)
+        if replaceable is None:
+            replaceable = tuple(
+                filter(
+                    self._is_replaceable,
+                    molecule.get_building_blocks(),
+                )
+            )
+            self._replaceable_building_blocks[molecule] = replaceable
+        return replaceable
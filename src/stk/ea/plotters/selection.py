@@ -166,9 +166,10 @@ class SelectionPlotter:
         @wraps(select)
         def inner(population, *args, **kwargs):
 
-            counter = Counter({record: 0 for record in population})
+            counter = Counter(dict.fromkeys(population, 0))
             for selected in select(population, *args, **kwargs):
-                counter.update(selected)
+                for record in selected:
+                    counter[record] += 1
                 yield selected
             self._plot(population, counter)
 
@@ -229,7 +230,7 @@ class SelectionPlotter:
             hue="heat_map",
             palette="magma_r",
             data=df,
-            s=[200 for i in range(len(counter.keys()))],
+            s=[200] * len(counter),
             ax=ax,
         )
         ax.get_legend().remove()
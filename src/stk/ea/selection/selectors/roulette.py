@@ -171,7 +171,16 @@ class Roulette(Selector):
             weights = [
                 batch.get_fitness_value() / total for batch in batches
             ]
-            yield self._generator.choice(batches, p=weights)
+            # Equivalent to RandomState.choice(batches, p=weights),
+            # without converting the batches into an array.
+            cumulative_weights = np.cumsum(weights)
+            cumulative_weights /= cumulative_weights[-1]
+            yield batches[
+                cumulative_weights.searchsorted(
+                    self._generator.random_sample(),
+                    side="right",
+                )
+            ]
 
             if not self._duplicate_molecules:
                 batches = filter(
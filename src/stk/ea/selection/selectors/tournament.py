@@ -132,10 +132,14 @@ class Tournament(Selector):
             tournament_size = self._generator.randint(
                 low=2, high=len(batches) + 1
             )
-            competitors = self._generator.choice(
-                a=batches, size=tournament_size, replace=False
+            # Equivalent to RandomState.choice(batches,
+            # tournament_size, replace=False), without converting the
+            # batches into an array.
+            competitors = self._generator.permutation(len(batches))
+            yield max(
+                batches[index]
+                for index in competitors[:tournament_size]
             )
-            yield max(competitors)
 
             if not self._duplicate_molecules:
                 batches = filter(
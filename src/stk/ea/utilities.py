@@ -0,0 +1,57 @@
+"""
+EA Utilities
+============
+
+"""
+
+import numpy as np
+
+
+def _get_cumulative_weights(weights, num_items):
+    """
+    Get the normalized cumulative distribution of `weights`.
+
+    `weights` are checked in the same way
+    :meth:`numpy.random.RandomState.choice` checks its `p` parameter.
+
+    Parameters
+    ----------
+    weights : :class:`tuple` of :class:`float`
+        For each item, the probability that it will be chosen.
+
+    num_items : :class:`int`
+        The number of items being chosen from.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The cumulative distribution, for use with
+        :meth:`numpy.ndarray.searchsorted`.
+
+    Raises
+    ------
+    :class:`ValueError`
+        If there is not exactly one weight for each item, if any
+        weight is negative, or if the weights do not sum to 1.
+
+    """
+
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.ndim != 1 or len(weights) != num_items:
+        raise ValueError(
+            f"{num_items} items were given, but the weights "
+            f"{weights.tolist()} do not have one weight per item."
+        )
+    if np.any(weights < 0):
+        raise ValueError(
+            f"The weights {weights.tolist()} are not non-negative."
+        )
+    # The same tolerance as numpy.random.RandomState.choice.
+    tolerance = np.sqrt(np.finfo(np.float64).eps)
+    if not abs(weights.sum() - 1) <= tolerance:
+        raise ValueError(
+            f"The weights {weights.tolist()} do not sum to 1."
+        )
+
+    cumulative_weights = np.cumsum(weights)
+    return cumulative_weights / cumulative_weights[-1]
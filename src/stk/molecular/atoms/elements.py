@@ -8,12 +8,10 @@ Defines an :class:`.Atom` class for each element.
 
 from __future__ import annotations
 
-from typing import ClassVar, TypeVar
+from typing import ClassVar
 
 from .atom import Atom
 
-_T = TypeVar("_T", bound="AtomImpl")
-
 
 class AtomImpl(Atom):
     """
@@ -38,17 +36,8 @@ class AtomImpl(Atom):
     def get_id(self) -> int:
         return self._id
 
-    def _with_id(self: _T, id: int) -> _T:
-        """
-        Modify the atom.
-
-        """
-
-        self._id = id
-        return self
-
     def with_id(self, id: int) -> AtomImpl:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
     def get_atomic_number(self) -> int:
         return self._atomic_number
@@ -76,7 +65,7 @@ class H(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> H:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class He(AtomImpl):
@@ -86,7 +75,7 @@ class He(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> He:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Li(AtomImpl):
@@ -96,7 +85,7 @@ class Li(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Li:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Be(AtomImpl):
@@ -106,7 +95,7 @@ class Be(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Be:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class B(AtomImpl):
@@ -116,7 +105,7 @@ class B(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> B:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class C(AtomImpl):
@@ -126,7 +115,7 @@ class C(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> C:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class N(AtomImpl):
@@ -136,7 +125,7 @@ class N(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> N:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 # "O" is a valid elemental symbol.
@@ -147,7 +136,7 @@ class O(AtomImpl):  # noqa
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> O:  # noqa
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class F(AtomImpl):
@@ -157,7 +146,7 @@ class F(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> F:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ne(AtomImpl):
@@ -167,7 +156,7 @@ class Ne(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ne:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Na(AtomImpl):
@@ -177,7 +166,7 @@ class Na(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Na:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Mg(AtomImpl):
@@ -187,7 +176,7 @@ class Mg(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Mg:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Al(AtomImpl):
@@ -197,7 +186,7 @@ class Al(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Al:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Si(AtomImpl):
@@ -207,7 +196,7 @@ class Si(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Si:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class P(AtomImpl):
@@ -217,7 +206,7 @@ class P(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> P:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class S(AtomImpl):
@@ -227,7 +216,7 @@ class S(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> S:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Cl(AtomImpl):
@@ -237,7 +226,7 @@ class Cl(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Cl:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ar(AtomImpl):
@@ -247,7 +236,7 @@ class Ar(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ar:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class K(AtomImpl):
@@ -257,7 +246,7 @@ class K(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> K:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ca(AtomImpl):
@@ -267,7 +256,7 @@ class Ca(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ca:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Sc(AtomImpl):
@@ -277,7 +266,7 @@ class Sc(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Sc:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ti(AtomImpl):
@@ -287,7 +276,7 @@ class Ti(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ti:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class V(AtomImpl):
@@ -297,7 +286,7 @@ class V(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> V:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Cr(AtomImpl):
@@ -307,7 +296,7 @@ class Cr(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Cr:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Mn(AtomImpl):
@@ -317,7 +306,7 @@ class Mn(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Mn:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Fe(AtomImpl):
@@ -327,7 +316,7 @@ class Fe(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Fe:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Co(AtomImpl):
@@ -337,7 +326,7 @@ class Co(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Co:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ni(AtomImpl):
@@ -347,7 +336,7 @@ class Ni(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ni:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Cu(AtomImpl):
@@ -357,7 +346,7 @@ class Cu(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Cu:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Zn(AtomImpl):
@@ -367,7 +356,7 @@ class Zn(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Zn:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ga(AtomImpl):
@@ -377,7 +366,7 @@ class Ga(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ga:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ge(AtomImpl):
@@ -387,7 +376,7 @@ class Ge(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ge:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class As(AtomImpl):
@@ -397,7 +386,7 @@ class As(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> As:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Se(AtomImpl):
@@ -407,7 +396,7 @@ class Se(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Se:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Br(AtomImpl):
@@ -417,7 +406,7 @@ class Br(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Br:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Kr(AtomImpl):
@@ -427,7 +416,7 @@ class Kr(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Kr:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Rb(AtomImpl):
@@ -437,7 +426,7 @@ class Rb(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Rb:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Sr(AtomImpl):
@@ -447,7 +436,7 @@ class Sr(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Sr:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Y(AtomImpl):
@@ -457,7 +446,7 @@ class Y(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Y:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Zr(AtomImpl):
@@ -467,7 +456,7 @@ class Zr(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Zr:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Nb(AtomImpl):
@@ -477,7 +466,7 @@ class Nb(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Nb:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Mo(AtomImpl):
@@ -487,7 +476,7 @@ class Mo(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Mo:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Tc(AtomImpl):
@@ -497,7 +486,7 @@ class Tc(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Tc:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ru(AtomImpl):
@@ -507,7 +496,7 @@ class Ru(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ru:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Rh(AtomImpl):
@@ -517,7 +506,7 @@ class Rh(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Rh:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Pd(AtomImpl):
@@ -527,7 +516,7 @@ class Pd(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Pd:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ag(AtomImpl):
@@ -537,7 +526,7 @@ class Ag(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ag:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Cd(AtomImpl):
@@ -547,7 +536,7 @@ class Cd(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Cd:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class In(AtomImpl):
@@ -557,7 +546,7 @@ class In(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> In:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Sn(AtomImpl):
@@ -567,7 +556,7 @@ class Sn(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Sn:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Sb(AtomImpl):
@@ -577,7 +566,7 @@ class Sb(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Sb:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Te(AtomImpl):
@@ -587,7 +576,7 @@ class Te(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Te:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 # "I" is a valid elemental symbol.
@@ -598,7 +587,7 @@ class I(AtomImpl):  # noqa
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> I:  # noqa
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Xe(AtomImpl):
@@ -608,7 +597,7 @@ class Xe(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Xe:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Cs(AtomImpl):
@@ -618,7 +607,7 @@ class Cs(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Cs:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ba(AtomImpl):
@@ -628,7 +617,7 @@ class Ba(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ba:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class La(AtomImpl):
@@ -638,7 +627,7 @@ class La(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> La:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ce(AtomImpl):
@@ -648,7 +637,7 @@ class Ce(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ce:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Pr(AtomImpl):
@@ -658,7 +647,7 @@ class Pr(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Pr:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Nd(AtomImpl):
@@ -668,7 +657,7 @@ class Nd(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Nd:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Pm(AtomImpl):
@@ -678,7 +667,7 @@ class Pm(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Pm:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Sm(AtomImpl):
@@ -688,7 +677,7 @@ class Sm(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Sm:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Eu(AtomImpl):
@@ -698,7 +687,7 @@ class Eu(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Eu:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Gd(AtomImpl):
@@ -708,7 +697,7 @@ class Gd(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Gd:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Tb(AtomImpl):
@@ -718,7 +707,7 @@ class Tb(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Tb:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Dy(AtomImpl):
@@ -728,7 +717,7 @@ class Dy(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Dy:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ho(AtomImpl):
@@ -738,7 +727,7 @@ class Ho(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ho:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Er(AtomImpl):
@@ -748,7 +737,7 @@ class Er(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Er:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Tm(AtomImpl):
@@ -758,7 +747,7 @@ class Tm(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Tm:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Yb(AtomImpl):
@@ -768,7 +757,7 @@ class Yb(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Yb:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Lu(AtomImpl):
@@ -778,7 +767,7 @@ class Lu(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Lu:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Hf(AtomImpl):
@@ -788,7 +777,7 @@ class Hf(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Hf:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ta(AtomImpl):
@@ -798,7 +787,7 @@ class Ta(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ta:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class W(AtomImpl):
@@ -808,7 +797,7 @@ class W(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> W:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Re(AtomImpl):
@@ -818,7 +807,7 @@ class Re(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Re:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Os(AtomImpl):
@@ -828,7 +817,7 @@ class Os(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Os:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ir(AtomImpl):
@@ -838,7 +827,7 @@ class Ir(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ir:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Pt(AtomImpl):
@@ -848,7 +837,7 @@ class Pt(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Pt:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Au(AtomImpl):
@@ -858,7 +847,7 @@ class Au(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Au:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Hg(AtomImpl):
@@ -868,7 +857,7 @@ class Hg(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Hg:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Tl(AtomImpl):
@@ -878,7 +867,7 @@ class Tl(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Tl:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Pb(AtomImpl):
@@ -888,7 +877,7 @@ class Pb(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Pb:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Bi(AtomImpl):
@@ -898,7 +887,7 @@ class Bi(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Bi:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Po(AtomImpl):
@@ -908,7 +897,7 @@ class Po(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Po:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class At(AtomImpl):
@@ -918,7 +907,7 @@ class At(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> At:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Rn(AtomImpl):
@@ -928,7 +917,7 @@ class Rn(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Rn:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Fr(AtomImpl):
@@ -938,7 +927,7 @@ class Fr(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Fr:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ra(AtomImpl):
@@ -948,7 +937,7 @@ class Ra(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ra:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ac(AtomImpl):
@@ -958,7 +947,7 @@ class Ac(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ac:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Th(AtomImpl):
@@ -968,7 +957,7 @@ class Th(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Th:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Pa(AtomImpl):
@@ -978,7 +967,7 @@ class Pa(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Pa:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class U(AtomImpl):
@@ -988,7 +977,7 @@ class U(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> U:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Np(AtomImpl):
@@ -998,7 +987,7 @@ class Np(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Np:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Pu(AtomImpl):
@@ -1008,7 +997,7 @@ class Pu(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Pu:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Am(AtomImpl):
@@ -1018,7 +1007,7 @@ class Am(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Am:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Cm(AtomImpl):
@@ -1028,7 +1017,7 @@ class Cm(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Cm:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Bk(AtomImpl):
@@ -1038,7 +1027,7 @@ class Bk(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Bk:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Cf(AtomImpl):
@@ -1048,7 +1037,7 @@ class Cf(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Cf:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Es(AtomImpl):
@@ -1058,7 +1047,7 @@ class Es(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Es:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Fm(AtomImpl):
@@ -1068,7 +1057,7 @@ class Fm(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Fm:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Md(AtomImpl):
@@ -1078,7 +1067,7 @@ class Md(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Md:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class No(AtomImpl):
@@ -1088,7 +1077,7 @@ class No(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> No:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Lr(AtomImpl):
@@ -1098,7 +1087,7 @@ class Lr(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Lr:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Rf(AtomImpl):
@@ -1108,7 +1097,7 @@ class Rf(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Rf:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Db(AtomImpl):
@@ -1118,7 +1107,7 @@ class Db(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Db:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Sg(AtomImpl):
@@ -1128,7 +1117,7 @@ class Sg(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Sg:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Bh(AtomImpl):
@@ -1138,7 +1127,7 @@ class Bh(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Bh:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Hs(AtomImpl):
@@ -1148,7 +1137,7 @@ class Hs(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Hs:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Mt(AtomImpl):
@@ -1158,7 +1147,7 @@ class Mt(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Mt:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ds(AtomImpl):
@@ -1168,7 +1157,7 @@ class Ds(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ds:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Rg(AtomImpl):
@@ -1178,7 +1167,7 @@ class Rg(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Rg:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Cn(AtomImpl):
@@ -1188,7 +1177,7 @@ class Cn(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Cn:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Nh(AtomImpl):
@@ -1198,7 +1187,7 @@ class Nh(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Nh:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Fl(AtomImpl):
@@ -1208,7 +1197,7 @@ class Fl(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Fl:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Mc(AtomImpl):
@@ -1218,7 +1207,7 @@ class Mc(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Mc:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Lv(AtomImpl):
@@ -1228,7 +1217,7 @@ class Lv(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Lv:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Ts(AtomImpl):
@@ -1238,7 +1227,7 @@ class Ts(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Ts:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
 
 
 class Og(AtomImpl):
@@ -1248,4 +1237,4 @@ class Og(AtomImpl):
         return type(self)(self._id, self._charge)
 
     def with_id(self, id: int) -> Og:
-        return self.clone()._with_id(id)
+        return type(self)(id, self._charge)
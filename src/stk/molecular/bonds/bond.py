@@ -223,7 +223,7 @@ class Bond:
 
         """
 
-        return any(direction != 0 for direction in self._periodicity)
+        return any(self._periodicity)
 
     def __repr__(self) -> str:
         periodicity = (
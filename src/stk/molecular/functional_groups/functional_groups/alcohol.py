@@ -21,6 +21,12 @@ class Alcohol(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_oxygen",
+        "_hydrogen",
+        "_atom",
+    )
+
     def __init__(
         self,
         oxygen: O,  # noqa: Not an ambiguous name.
@@ -21,6 +21,13 @@ class Aldehyde(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_carbon",
+        "_oxygen",
+        "_hydrogen",
+        "_atom",
+    )
+
     def __init__(
         self,
         carbon: C,
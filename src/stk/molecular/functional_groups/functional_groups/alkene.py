@@ -21,6 +21,15 @@ class Alkene(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_carbon1",
+        "_atom1",
+        "_atom2",
+        "_carbon2",
+        "_atom3",
+        "_atom4",
+    )
+
     def __init__(
         self,
         carbon1: C,
@@ -21,6 +21,13 @@ class Alkyne(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_carbon1",
+        "_atom1",
+        "_carbon2",
+        "_atom2",
+    )
+
     def __init__(
         self,
         carbon1: C,
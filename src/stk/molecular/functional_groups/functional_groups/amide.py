@@ -21,6 +21,15 @@ class Amide(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_carbon",
+        "_oxygen",
+        "_nitrogen",
+        "_hydrogen1",
+        "_hydrogen2",
+        "_atom",
+    )
+
     def __init__(
         self,
         carbon: C,
@@ -21,6 +21,15 @@ class BoronicAcid(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_boron",
+        "_oxygen1",
+        "_hydrogen1",
+        "_oxygen2",
+        "_hydrogen2",
+        "_atom",
+    )
+
     def __init__(
         self,
         boron: B,
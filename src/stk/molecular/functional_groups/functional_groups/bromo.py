@@ -21,6 +21,11 @@ class Bromo(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_bromine",
+        "_atom",
+    )
+
     def __init__(
         self,
         bromine: Br,
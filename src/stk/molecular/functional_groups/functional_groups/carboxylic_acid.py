@@ -16,6 +16,14 @@ class CarboxylicAcid(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_carbon",
+        "_oxygen1",
+        "_oxygen2",
+        "_hydrogen",
+        "_atom",
+    )
+
     def __init__(
         self,
         carbon,
@@ -144,30 +152,6 @@ class CarboxylicAcid(GenericFunctionalGroup):
         clone._atom = self._atom
         return clone
 
-    def with_atoms(self, atom_map):
-        clone = super().with_atoms(atom_map)
-        clone._carbon = atom_map.get(
-            self._carbon.get_id(),
-            self._carbon,
-        )
-        clone._oxygen1 = atom_map.get(
-            self._oxygen1.get_id(),
-            self._oxygen1,
-        )
-        clone._oxygen2 = atom_map.get(
-            self._oxygen2.get_id(),
-            self._oxygen2,
-        )
-        clone._hydrogen = atom_map.get(
-            self._hydrogen.get_id(),
-            self._hydrogen,
-        )
-        clone._atom = atom_map.get(
-            self._atom.get_id(),
-            self._atom,
-        )
-        return clone
-
     def __repr__(self):
         return (
             f"{self.__class__.__name__}("
@@ -16,6 +16,13 @@ class Dibromo(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_bromine1",
+        "_atom1",
+        "_bromine2",
+        "_atom2",
+    )
+
     def __init__(
         self,
         bromine1,
@@ -125,26 +132,6 @@ class Dibromo(GenericFunctionalGroup):
         clone._bromine2 = self._bromine2
         return clone
 
-    def with_atoms(self, atom_map):
-        clone = super().with_atoms(atom_map)
-        clone._atom1 = atom_map.get(
-            self._atom1.get_id(),
-            self._atom1,
-        )
-        clone._bromine1 = atom_map.get(
-            self._bromine1.get_id(),
-            self._bromine1,
-        )
-        clone._atom2 = atom_map.get(
-            self._atom2.get_id(),
-            self._atom2,
-        )
-        clone._bromine2 = atom_map.get(
-            self._bromine2.get_id(),
-            self._bromine2,
-        )
-        return clone
-
     def __repr__(self):
         return (
             f"{self.__class__.__name__}("
@@ -16,6 +16,13 @@ class Difluoro(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_fluorine1",
+        "_atom1",
+        "_fluorine2",
+        "_atom2",
+    )
+
     def __init__(
         self,
         fluorine1,
@@ -111,26 +118,6 @@ class Difluoro(GenericFunctionalGroup):
 
         return self._fluorine2
 
-    def with_atoms(self, atom_map):
-        clone = super().with_atoms(atom_map)
-        clone._atom1 = atom_map.get(
-            self._atom1.get_id(),
-            self._atom1,
-        )
-        clone._fluorine1 = atom_map.get(
-            self._fluorine1.get_id(),
-            self._fluorine1,
-        )
-        clone._atom2 = atom_map.get(
-            self._atom2.get_id(),
-            self._atom2,
-        )
-        clone._fluorine2 = atom_map.get(
-            self._fluorine2.get_id(),
-            self._fluorine2,
-        )
-        return clone
-
     def clone(self):
         clone = super().clone()
         clone._atom1 = self._atom1
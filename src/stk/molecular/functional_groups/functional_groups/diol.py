@@ -16,6 +16,15 @@ class Diol(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_atom1",
+        "_oxygen1",
+        "_hydrogen1",
+        "_atom2",
+        "_oxygen2",
+        "_hydrogen2",
+    )
+
     def __init__(
         self,
         atom1,
@@ -164,34 +173,6 @@ class Diol(GenericFunctionalGroup):
         clone._hydrogen2 = self._hydrogen2
         return clone
 
-    def with_atoms(self, atom_map):
-        clone = super().with_atoms(atom_map)
-        clone._atom1 = atom_map.get(
-            self._atom1.get_id(),
-            self._atom1,
-        )
-        clone._oxygen1 = atom_map.get(
-            self._oxygen1.get_id(),
-            self._oxygen1,
-        )
-        clone._hydrogen1 = atom_map.get(
-            self._hydrogen1.get_id(),
-            self._hydrogen1,
-        )
-        clone._atom2 = atom_map.get(
-            self._atom2.get_id(),
-            self._atom2,
-        )
-        clone._oxygen2 = atom_map.get(
-            self._oxygen2.get_id(),
-            self._oxygen2,
-        )
-        clone._hydrogen2 = atom_map.get(
-            self._hydrogen2.get_id(),
-            self._hydrogen2,
-        )
-        return clone
-
     def __repr__(self):
         return (
             f"{self.__class__.__name__}("
@@ -16,6 +16,11 @@ class Fluoro(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_fluorine",
+        "_atom",
+    )
+
     def __init__(
         self,
         fluorine,
@@ -87,18 +92,6 @@ class Fluoro(GenericFunctionalGroup):
         clone._atom = self._atom
         return clone
 
-    def with_atoms(self, atom_map):
-        clone = super().with_atoms(atom_map)
-        clone._fluorine = atom_map.get(
-            self._fluorine.get_id(),
-            self._fluorine,
-        )
-        clone._atom = atom_map.get(
-            self._atom.get_id(),
-            self._atom,
-        )
-        return clone
-
     def __repr__(self):
         return (
             f"{self.__class__.__name__}("
@@ -238,6 +238,12 @@ class FunctionalGroup:
 
     """
 
+    __slots__ = (
+        "_atoms",
+        "_placers",
+        "_core_atoms",
+    )
+
     def __init__(
         self,
         atoms: tuple[Atom, ...],
@@ -333,47 +339,66 @@ class FunctionalGroup:
 
         """
 
+        get_atom = atom_map.get
+
+        def replace(atoms: tuple[Atom, ...]) -> tuple[Atom, ...]:
+            return tuple([get_atom(a.get_id(), a) for a in atoms])
+
         # The clone needs to be downcasted.
         return FunctionalGroup(
-            atoms=tuple(
-                atom_map.get(a.get_id(), a) for a in self._atoms
-            ),
-            placers=tuple(
-                atom_map.get(a.get_id(), a) for a in self._placers
-            ),
-            core_atoms=tuple(
-                atom_map.get(a.get_id(), a) for a in self._core_atoms
-            ),
+            atoms=replace(self._atoms),
+            placers=replace(self._placers),
+            core_atoms=replace(self._core_atoms),
         )
 
+    def _get_held_atoms(self) -> typing.Iterator[Atom]:
+        """
+        Yield every atom held by the functional group.
+
+        Atoms held in more than one role are yielded more than once.
+        Subclasses, which hold atoms in additional roles, extend this.
+
+        Yields:
+            An atom held by the functional group.
+
+        """
+
+        yield from self._atoms
+        yield from self._placers
+        yield from self._core_atoms
+
     def _with_ids(self, id_map: dict[int, int]) -> FunctionalGroup:
-        self._atoms = tuple(
-            atom.with_id(
-                id=id_map.get(
-                    atom.get_id(),
-                    atom.get_id(),
-                ),
-            )
-            for atom in self._atoms
-        )
-        self._placers = tuple(
-            atom.with_id(
-                id=id_map.get(
-                    atom.get_id(),
-                    atom.get_id(),
-                ),
-            )
-            for atom in self._placers
-        )
-        self._core_atoms = tuple(
-            atom.with_id(
-                id=id_map.get(
-                    atom.get_id(),
-                    atom.get_id(),
-                ),
-            )
-            for atom in self._core_atoms
-        )
+        # Nothing needs to change if none of the held atoms is
+        # remapped. Every role is checked, because the initializer
+        # does not require placers, for example, to be in the atoms.
+        if id_map.keys().isdisjoint(
+            atom.get_id() for atom in self._get_held_atoms()
+        ):
+            return self
+        return self._with_remapped_ids(id_map)
+
+    def _with_remapped_ids(
+        self,
+        id_map: dict[int, int],
+    ) -> FunctionalGroup:
+        """
+        Modify the functional group.
+
+        This is only called by :meth:`_with_ids` if at least one of
+        the held atoms is remapped. Subclasses, which hold atoms in
+        additional roles, extend this.
+
+        """
+
+        def with_id(atom: Atom) -> Atom:
+            atom_id = atom.get_id()
+            if atom_id not in id_map:
+                return atom
+            return atom.with_id(id=id_map[atom_id])
+
+        self._atoms = tuple(map(with_id, self._atoms))
+        self._placers = tuple(map(with_id, self._placers))
+        self._core_atoms = tuple(map(with_id, self._core_atoms))
         return self
 
     def with_ids(
@@ -417,12 +442,9 @@ class FunctionalGroup:
         """
 
         clone = self.__class__.__new__(self.__class__)
-        FunctionalGroup.__init__(
-            self=clone,
-            atoms=self._atoms,
-            placers=self._placers,
-            core_atoms=self._core_atoms,
-        )
+        clone._atoms = self._atoms
+        clone._placers = self._placers
+        clone._core_atoms = self._core_atoms
         return clone
 
     def clone(self) -> FunctionalGroup:
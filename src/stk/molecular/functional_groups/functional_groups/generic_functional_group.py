@@ -29,6 +29,14 @@ class GenericFunctionalGroup(FunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_bonders",
+        "_deleters",
+        "_bonder_ids",
+        "_deleter_ids",
+        "_deleter_id_set",
+    )
+
     def __init__(
         self,
         atoms: tuple[Atom, ...],
@@ -56,23 +64,52 @@ class GenericFunctionalGroup(FunctionalGroup):
 
         """
 
-        deleter_set = set(atom.get_id() for atom in deleters)
+        self._bonders = bonders
+        self._deleters = deleters
+        self._set_role_ids()
         super().__init__(
             atoms=atoms,
             placers=bonders if placers is None else placers,
             core_atoms=tuple(
                 atom
                 for atom in atoms
-                if atom.get_id() not in deleter_set
+                if atom.get_id() not in self._deleter_id_set
             ),
         )
-        self._bonders = bonders
-        self._deleters = deleters
+
+    def _set_role_ids(self) -> None:
+        """
+        Derive the bonder and deleter ids from the atoms.
+
+        The ids are stored, because they are requested far more
+        often than the atoms change. The deleter ids are also held
+        as a set, which is used to find the core atoms. This must be
+        called whenever the bonders or deleters are replaced.
+
+        """
+
+        self._bonder_ids = tuple(
+            atom.get_id() for atom in self._bonders
+        )
+        self._deleter_ids = tuple(
+            atom.get_id() for atom in self._deleters
+        )
+        self._deleter_id_set = frozenset(self._deleter_ids)
 
     def _clone(self: _T) -> _T:
-        clone = super()._clone()
+        # Assigns every slot directly, rather than going through
+        # FunctionalGroup._clone(), because this is called for every
+        # functional group of every building block during
+        # construction.
+        clone = self.__class__.__new__(self.__class__)
+        clone._atoms = self._atoms
+        clone._placers = self._placers
+        clone._core_atoms = self._core_atoms
         clone._bonders = self._bonders
         clone._deleters = self._deleters
+        clone._bonder_ids = self._bonder_ids
+        clone._deleter_ids = self._deleter_ids
+        clone._deleter_id_set = self._deleter_id_set
         return clone
 
     def clone(self) -> GenericFunctionalGroup:
@@ -83,41 +120,35 @@ class GenericFunctionalGroup(FunctionalGroup):
         atom_map: dict[int, Atom],
     ) -> GenericFunctionalGroup:
 
+        get_atom = atom_map.get
+
+        def replace(atoms: tuple[Atom, ...]) -> tuple[Atom, ...]:
+            return tuple([get_atom(a.get_id(), a) for a in atoms])
+
         return GenericFunctionalGroup(
-            atoms=tuple(
-                atom_map.get(a.get_id(), a) for a in self._atoms
-            ),
-            bonders=tuple(
-                atom_map.get(a.get_id(), a) for a in self._bonders
-            ),
-            deleters=tuple(
-                atom_map.get(a.get_id(), a) for a in self._deleters
-            ),
-            placers=tuple(
-                atom_map.get(a.get_id(), a) for a in self._placers
-            ),
+            atoms=replace(self._atoms),
+            bonders=replace(self._bonders),
+            deleters=replace(self._deleters),
+            placers=replace(self._placers),
         )
 
-    def _with_ids(self: _T, id_map: dict[int, int]) -> _T:
-        super()._with_ids(id_map)
-        self._bonders = tuple(
-            bonder.with_id(
-                id=id_map.get(
-                    bonder.get_id(),
-                    bonder.get_id(),
-                )
-            )
-            for bonder in self._bonders
-        )
-        self._deleters = tuple(
-            deleter.with_id(
-                id=id_map.get(
-                    deleter.get_id(),
-                    deleter.get_id(),
-                ),
-            )
-            for deleter in self._deleters
-        )
+    def _get_held_atoms(self) -> typing.Iterator[Atom]:
+        yield from super()._get_held_atoms()
+        yield from self._bonders
+        yield from self._deleters
+
+    def _with_remapped_ids(self: _T, id_map: dict[int, int]) -> _T:
+        super()._with_remapped_ids(id_map)
+
+        def with_id(atom: Atom) -> Atom:
+            atom_id = atom.get_id()
+            if atom_id not in id_map:
+                return atom
+            return atom.with_id(id=id_map[atom_id])
+
+        self._bonders = tuple(map(with_id, self._bonders))
+        self._deleters = tuple(map(with_id, self._deleters))
+        self._set_role_ids()
         return self
 
     def with_ids(
@@ -161,7 +192,21 @@ class GenericFunctionalGroup(FunctionalGroup):
 
         """
 
-        yield from (a.get_id() for a in self._bonders)
+        yield from self._bonder_ids
+
+    def is_bonder(self, atom_id: int) -> bool:
+        """
+        Check if an atom is a bonder atom.
+
+        Parameters:
+            atom_id: The id of the atom to check.
+
+        Returns:
+            ``True`` if the atom with `atom_id` is a bonder atom.
+
+        """
+
+        return atom_id in self._bonder_ids
 
     def get_deleters(self) -> typing.Iterator[Atom]:
         """
@@ -186,7 +231,21 @@ class GenericFunctionalGroup(FunctionalGroup):
 
         """
 
-        yield from (a.get_id() for a in self._deleters)
+        yield from self._deleter_ids
+
+    def is_deleter(self, atom_id: int) -> bool:
+        """
+        Check if an atom is a deleter atom.
+
+        Parameters:
+            atom_id: The id of the atom to check.
+
+        Returns:
+            ``True`` if the atom with `atom_id` is a deleter atom.
+
+        """
+
+        return atom_id in self._deleter_id_set
 
     def __repr__(self) -> str:
         return (
@@ -16,6 +16,11 @@ class Iodo(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_iodine",
+        "_atom",
+    )
+
     def __init__(self, iodine, atom, bonders, deleters, placers=None):
         """
         Initialize a :class:`.Iodo` instance.
@@ -80,18 +85,6 @@ class Iodo(GenericFunctionalGroup):
         clone._atom = self._atom
         return clone
 
-    def with_atoms(self, atom_map):
-        clone = super().with_atoms(atom_map)
-        clone._iodine = atom_map.get(
-            self._iodine.get_id(),
-            self._iodine,
-        )
-        clone._atom = atom_map.get(
-            self._atom.get_id(),
-            self._atom,
-        )
-        return clone
-
     def __repr__(self):
         return (
             f"{self.__class__.__name__}("
@@ -16,6 +16,13 @@ class PrimaryAmino(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_nitrogen",
+        "_hydrogen1",
+        "_hydrogen2",
+        "_atom",
+    )
+
     def __init__(
         self,
         nitrogen,
@@ -133,23 +140,3 @@ class PrimaryAmino(GenericFunctionalGroup):
         clone._hydrogen2 = self._hydrogen2
         clone._atom = self._atom
         return clone
-
-    def with_atoms(self, atom_map):
-        clone = super().with_atoms(atom_map)
-        clone._nitrogen = atom_map.get(
-            self._nitrogen.get_id(),
-            self._nitrogen,
-        )
-        clone._hydrogen1 = atom_map.get(
-            self._hydrogen1.get_id(),
-            self._hydrogen1,
-        )
-        clone._hydrogen2 = atom_map.get(
-            self._hydrogen2.get_id(),
-            self._hydrogen2,
-        )
-        clone._atom = atom_map.get(
-            self._atom.get_id(),
-            self._atom,
-        )
-        return clone
@@ -17,6 +17,16 @@ class RingAmine(FunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_nitrogen",
+        "_hydrogen1",
+        "_hydrogen2",
+        "_hydrogen3",
+        "_carbon1",
+        "_carbon2",
+        "_carbon3",
+    )
+
     def __init__(
         self,
         nitrogen,
@@ -179,38 +189,6 @@ class RingAmine(FunctionalGroup):
         clone._carbon3 = self._carbon3
         return clone
 
-    def with_atoms(self, atom_map):
-        clone = super().with_atoms(atom_map)
-        clone._nitrogen = atom_map.get(
-            self._nitrogen.get_id(),
-            self._nitrogen,
-        )
-        clone._hydrogen1 = atom_map.get(
-            self._hydrogen1.get_id(),
-            self._hydrogen1,
-        )
-        clone._hydrogen2 = atom_map.get(
-            self._hydrogen2.get_id(),
-            self._hydrogen2,
-        )
-        clone._hydrogen3 = atom_map.get(
-            self._hydrogen3.get_id(),
-            self._hydrogen3,
-        )
-        clone._carbon1 = atom_map.get(
-            self._carbon1.get_id(),
-            self._carbon1,
-        )
-        clone._carbon2 = atom_map.get(
-            self._carbon2.get_id(),
-            self._carbon2,
-        )
-        clone._carbon3 = atom_map.get(
-            self._carbon3.get_id(),
-            self._carbon3,
-        )
-        return clone
-
     def __repr__(self):
         return (
             f"{self.__class__.__name__}("
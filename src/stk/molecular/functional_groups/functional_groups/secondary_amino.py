@@ -16,6 +16,13 @@ class SecondaryAmino(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_nitrogen",
+        "_hydrogen",
+        "_atom1",
+        "_atom2",
+    )
+
     def __init__(
         self,
         nitrogen,
@@ -125,26 +132,6 @@ class SecondaryAmino(GenericFunctionalGroup):
         clone._atom2 = self._atom2
         return clone
 
-    def with_atoms(self, atom_map):
-        clone = super().with_atoms(atom_map)
-        clone._nitrogen = atom_map.get(
-            self._nitrogen.get_id(),
-            self._nitrogen,
-        )
-        clone._hydrogen = atom_map.get(
-            self._hydrogen.get_id(),
-            self._hydrogen,
-        )
-        clone._atom1 = atom_map.get(
-            self._atom1.get_id(),
-            self._atom1,
-        )
-        clone._atom2 = atom_map.get(
-            self._atom2.get_id(),
-            self._atom2,
-        )
-        return clone
-
     def __repr__(self):
         return (
             f"{self.__class__.__name__}("
@@ -16,6 +16,8 @@ class SingleAtom(GenericFunctionalGroup):
 
     """
 
+    __slots__ = ("_atom",)
+
     def __init__(self, atom):
         """
         Initialize a :class:`.SingleAtom` instance.
@@ -44,15 +46,6 @@ class SingleAtom(GenericFunctionalGroup):
 
         return self._atom
 
-    def with_atoms(self, atom_map):
-
-        clone = super().with_atoms(atom_map)
-        clone._atom = atom_map.get(
-            self._atom.get_id(),
-            self._atom,
-        )
-        return clone
-
     def clone(self):
         clone = super().clone()
         clone._atom = self._atom
@@ -17,6 +17,12 @@ class Thiol(GenericFunctionalGroup):
 
     """
 
+    __slots__ = (
+        "_sulfur",
+        "_hydrogen",
+        "_atom",
+    )
+
     def __init__(
         self,
         sulfur,
@@ -107,22 +113,6 @@ class Thiol(GenericFunctionalGroup):
         clone._atom = self._atom
         return clone
 
-    def with_atoms(self, atom_map):
-        clone = super().with_atoms(atom_map)
-        clone._sulfur = atom_map.get(
-            self._sulfur.get_id(),
-            self._sulfur,
-        )
-        clone._hydrogen = atom_map.get(
-            self._hydrogen.get_id(),
-            self._hydrogen,
-        )
-        clone._atom = atom_map.get(
-            self._atom.get_id(),
-            self._atom,
-        )
-        return clone
-
     def __repr__(self):
         return (
             f"{self.__class__.__name__}("
@@ -549,20 +549,22 @@ class Molecule:
 
         """
 
+        # When all atoms are used, the position matrix is reduced
+        # directly, rather than through a copy gathered by index.
         if atom_ids is None:
-            atom_ids = range(len(self._atoms))
-        elif isinstance(atom_ids, int):
-            atom_ids = (atom_ids,)
-        elif not isinstance(atom_ids, (list, tuple)):
-            atom_ids = list(atom_ids)
-
-        if len(atom_ids) == 0:
+            positions = self._position_matrix
+        else:
+            if isinstance(atom_ids, int):
+                atom_ids = (atom_ids,)
+            elif not isinstance(atom_ids, (list, tuple)):
+                atom_ids = list(atom_ids)
+            positions = self._position_matrix[:, atom_ids]
+
+        num_atoms = positions.shape[1]
+        if num_atoms == 0:
             raise ValueError("atom_ids was of length 0.")
 
-        return np.divide(
-            self._position_matrix[:, atom_ids].sum(axis=1),
-            len(atom_ids),
-        )
+        return np.divide(positions.sum(axis=1), num_atoms)
 
     def get_direction(
         self,
@@ -591,16 +593,17 @@ class Molecule:
         """
 
         if atom_ids is None:
-            atom_ids = range(len(self._atoms))
-        elif isinstance(atom_ids, int):
-            atom_ids = (atom_ids,)
-        elif not isinstance(atom_ids, (list, tuple)):
-            atom_ids = list(atom_ids)
-
-        if len(atom_ids) == 0:
+            pos = self._position_matrix.T
+        else:
+            if isinstance(atom_ids, int):
+                atom_ids = (atom_ids,)
+            elif not isinstance(atom_ids, (list, tuple)):
+                atom_ids = list(atom_ids)
+            pos = self._position_matrix[:, atom_ids].T
+
+        if pos.shape[0] == 0:
             raise ValueError("atom_ids was of length 0.")
 
-        pos = self._position_matrix[:, atom_ids].T
         return np.around(
             a=np.linalg.svd(pos - pos.mean(axis=0))[-1][0],
             decimals=14,
@@ -636,16 +639,17 @@ class Molecule:
         """
 
         if atom_ids is None:
-            atom_ids = range(len(self._atoms))
-        elif isinstance(atom_ids, int):
-            atom_ids = (atom_ids,)
-        elif not isinstance(atom_ids, (list, tuple)):
-            atom_ids = list(atom_ids)
-
-        if len(atom_ids) == 0:
+            coords = self._position_matrix
+        else:
+            if isinstance(atom_ids, int):
+                atom_ids = (atom_ids,)
+            elif not isinstance(atom_ids, (list, tuple)):
+                atom_ids = list(atom_ids)
+            coords = self._position_matrix[:, atom_ids]
+
+        if coords.shape[1] == 0:
             raise ValueError("atom_ids was of length 0.")
 
-        coords = self._position_matrix[:, atom_ids]
         return float(euclidean(coords.min(axis=1), coords.max(axis=1)))
 
     def get_plane_normal(
@@ -674,19 +678,26 @@ class Molecule:
 
         """
 
+        # The positions are gathered once, and used for both the
+        # centroid and the plane.
         if atom_ids is None:
-            atom_ids = range(len(self._atoms))
-        elif isinstance(atom_ids, int):
-            atom_ids = (atom_ids,)
-        elif not isinstance(atom_ids, (list, tuple)):
-            atom_ids = list(atom_ids)
-
-        if len(atom_ids) == 0:
+            positions = self._position_matrix
+        else:
+            if isinstance(atom_ids, int):
+                atom_ids = (atom_ids,)
+            elif not isinstance(atom_ids, (list, tuple)):
+                atom_ids = list(atom_ids)
+            positions = self._position_matrix[:, atom_ids]
+
+        num_atoms = positions.shape[1]
+        if num_atoms == 0:
             raise ValueError("atom_ids was of length 0.")
 
-        pos = self._position_matrix[:, atom_ids].T
-        centroid = self.get_centroid(atom_ids)
-        return np.around(np.linalg.svd(pos - centroid)[-1][2, :], 14)
+        centroid = np.divide(positions.sum(axis=1), num_atoms)
+        return np.around(
+            np.linalg.svd(positions.T - centroid)[-1][2, :],
+            14,
+        )
 
     def get_position_matrix(self) -> np.ndarray:
         """
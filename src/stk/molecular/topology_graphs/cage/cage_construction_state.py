@@ -4,6 +4,8 @@ Cage Construction State
 
 """
 
+import numpy as np
+
 from ..topology_graph import ConstructionState
 
 
@@ -245,9 +247,9 @@ class _CageConstructionState(ConstructionState):
                 == self._vertex_degrees[vertex_id]
             ):
                 yield vertex.with_position(
-                    position=(
-                        sum(self._neighbor_positions[vertex_id])
-                        / len(self._neighbor_positions[vertex_id])
+                    position=np.mean(
+                        self._neighbor_positions[vertex_id],
+                        axis=0,
                     ),
                 )
             else:
@@ -32,7 +32,7 @@ class OnePlusOneVertex(NonLinearVertex):
 
     def clone(self):
         clone = super().clone()
-        clone._edge_normal = np.array(self._edge_normal)
+        clone._edge_normal = self._edge_normal.copy()
         return clone
 
     def place_building_block(self, building_block, edges):
@@ -40,9 +40,10 @@ class OnePlusOneVertex(NonLinearVertex):
             position=self._position,
             atom_ids=building_block.get_placer_ids(),
         )
-        edge_centroid = sum(
-            edge.get_position() for edge in edges
-        ) / len(edges)
+        edge_centroid = np.mean(
+            [edge.get_position() for edge in edges],
+            axis=0,
+        )
         core_centroid = building_block.get_centroid(
             atom_ids=building_block.get_core_atom_ids(),
         )
@@ -128,9 +128,9 @@ class _CageVertex(Vertex):
 
         return cls(
             id=id,
-            position=(
-                sum(vertex.get_position() for vertex in vertices)
-                / len(vertices)
+            position=np.mean(
+                [vertex.get_position() for vertex in vertices],
+                axis=0,
             ),
         )
 
@@ -172,9 +172,10 @@ class LinearVertex(_CageVertex):
             ).get_placer_ids(),
         )
         edge_position = edges[self._aligner_edge].get_position()
-        edge_centroid = sum(
-            edge.get_position() for edge in edges
-        ) / len(edges)
+        edge_centroid = np.mean(
+            [edge.get_position() for edge in edges],
+            axis=0,
+        )
         building_block = building_block.with_rotation_between_vectors(
             start=fg_centroid - self._position,
             target=edge_position - edge_centroid,
@@ -216,16 +217,15 @@ class NonLinearVertex(_CageVertex):
             position=self._position,
             atom_ids=building_block.get_placer_ids(),
         )
-        edge_centroid = sum(
-            edge.get_position() for edge in edges
-        ) / len(edges)
+        # Fetched once, because the edge positions are needed for
+        # both the centroid and the plane normal.
+        edge_positions = np.array(
+            [edge.get_position() for edge in edges]
+        )
+        edge_centroid = edge_positions.mean(axis=0)
         edge_normal = get_acute_vector(
             reference=edge_centroid,
-            vector=get_plane_normal(
-                points=np.array(
-                    [edge.get_position() for edge in edges]
-                ),
-            ),
+            vector=get_plane_normal(points=edge_positions),
         )
         core_centroid = building_block.get_centroid(
             atom_ids=building_block.get_core_atom_ids(),
@@ -303,9 +303,10 @@ class UnaligningVertex(_CageVertex):
     def init_at_center(cls, id, vertices):
         vertex = cls.__new__(cls)
         vertex._id = id
-        vertex._position = sum(
-            vertex.get_position() for vertex in vertices
-        ) / len(vertices)
+        vertex._position = np.mean(
+            [vertex.get_position() for vertex in vertices],
+            axis=0,
+        )
         vertex._use_neighbor_placement = True
         vertex._aligner_edge = 0
         return vertex
@@ -329,9 +330,10 @@ class AngledVertex(_CageVertex):
             ).get_placer_ids(),
         )
         edge_position = edges[self._aligner_edge].get_position()
-        edge_centroid = sum(
-            edge.get_position() for edge in edges
-        ) / len(edges)
+        edge_centroid = np.mean(
+            [edge.get_position() for edge in edges],
+            axis=0,
+        )
         building_block = building_block.with_rotation_between_vectors(
             start=fg_centroid - self._position,
             target=edge_position - edge_centroid,
@@ -345,9 +347,10 @@ class AngledVertex(_CageVertex):
             atom_ids=building_block.get_core_atom_ids(),
         )
         core_to_placer = placer_centroid - core_centroid
-        edge_centroid = sum(
-            edge.get_position() for edge in edges
-        ) / len(edges)
+        edge_centroid = np.mean(
+            [edge.get_position() for edge in edges],
+            axis=0,
+        )
 
         return building_block.with_rotation_between_vectors(
             start=core_to_placer,
@@ -334,6 +334,27 @@ class Cof(TopologyGraph):
             for vertex_id in edge.get_vertex_ids()
         )
         cls._allowed_degrees = set(vertex_degrees.values())
+        # Every edge prototype is cloned into every unit cell, so each
+        # vertex clone has the same degree as its prototype.
+        cls._vertex_prototype_degrees = tuple(
+            vertex_degrees[vertex.get_id()]
+            for vertex in cls._vertex_prototypes
+        )
+        # Stacked once, so that the positions of vertex clones can be
+        # calculated for the whole lattice at once.
+        cls._vertex_prototype_positions = np.array(
+            [
+                vertex.get_position()
+                for vertex in cls._vertex_prototypes
+            ]
+        )
+        cls._vertex_prototype_positions.setflags(write=False)
+        # Stacked once, so that the periodicity of edge clones can be
+        # calculated for the whole lattice at once.
+        cls._edge_prototype_periodicities = np.array(
+            [edge.get_periodicity() for edge in cls._edge_prototypes]
+        )
+        cls._edge_prototype_periodicities.setflags(write=False)
 
     def __init__(
         self,
@@ -459,7 +480,6 @@ class Cof(TopologyGraph):
                 self._get_building_block_vertices(
                     building_blocks=building_blocks,
                     vertices=vertices,
-                    edges=edges,
                 )
             )
 
@@ -574,9 +594,9 @@ class Cof(TopologyGraph):
 
         Parameters
         ----------
-        lattice : :class:`list`
-            A nested list which can be in the form
-            ``lattice[x][y][z][vertex_id]`` which returns a vertex
+        lattice : :class:`dict`
+            Maps ``(x, y, z, vertex_id)`` to the clone of the
+            vertex with id `vertex_id` in :attr:`_vertex_prototypes`,
             in the (x, y, z) cell of the lattice.
 
         Returns
@@ -586,19 +606,8 @@ class Cof(TopologyGraph):
 
         """
 
-        xdim, ydim, zdim = self._lattice_size
-        num_vertices = (
-            xdim * ydim * zdim * len(self._vertex_prototypes)
-        )
-        vertices = [None for i in range(num_vertices)]
-        for x, y, z in it.product(
-            range(xdim),
-            range(ydim),
-            range(zdim),
-        ):
-            for vertex in lattice[x][y][z].values():
-                vertices[vertex.get_id()] = vertex
-        return tuple(vertices)
+        # The clones were added to the lattice in order of their ids.
+        return tuple(lattice.values())
 
     def _get_lattice(self, vertex_alignments):
         """
@@ -622,30 +631,35 @@ class Cof(TopologyGraph):
 
         Returns
         -------
-        :class:`list`
-            A nested :class:`list` which can be indexed as
-            ``vertices[x][y][z]``, which will return a :class:`dict`
-            for the unit cell at (x, y, z). The :class:`dict` maps
-            the vertices in :attr:`_vertex_prototypes` to its clone for
-            that unit cell.
+        :class:`dict`
+            Maps ``(x, y, z, vertex_id)`` to the clone of the
+            vertex with id `vertex_id` in :attr:`_vertex_prototypes`,
+            in the (x, y, z) cell of the lattice.
 
         """
 
         xdim, ydim, zdim = (range(dim) for dim in self._lattice_size)
-        # vertex_clones is indexed as vertex_clones[x][y][z]
-        lattice = [[[{} for _ in zdim] for _ in ydim] for _ in xdim]
+        lattice = {}
+        # shifts[x, y, z] is the shift of the unit cell at (x, y, z),
+        # calculated for all cells at once.
+        a, b, c = self._lattice_constants
+        xs, ys, zs = np.indices(self._lattice_size)[..., np.newaxis]
+        shifts = xs * a + ys * b + zs * c
+        # The positions of all vertex clones, calculated at once.
+        # Clones are created in the order of the rows, so the row
+        # of each clone is its id.
+        positions = (
+            shifts[..., np.newaxis, :]
+            + self._vertex_prototype_positions
+        ).reshape(-1, 3)
         # Make a clone of each vertex for each unit cell.
         cells = it.product(xdim, ydim, zdim)
         vertices = it.product(cells, self._vertex_prototypes)
         for id_, (cell, vertex) in enumerate(vertices):
             x, y, z = cell
-            shift = sum(
-                axis * dim
-                for axis, dim in zip(cell, self._lattice_constants)
-            )
-            lattice[x][y][z][vertex.get_id()] = vertex.__class__(
+            lattice[x, y, z, vertex.get_id()] = vertex.__class__(
                 id=id_,
-                position=vertex.get_position() + shift,
+                position=positions[id_],
                 aligner_edge=vertex_alignments.get(id_, 0),
                 cell=cell,
             )
@@ -657,12 +671,10 @@ class Cof(TopologyGraph):
 
         Parameters
         ----------
-        lattice : :class:`list`
-            A nested :class:`list` which can be indexed as
-            ``vertices[x][y][z]``, which will return a :class:`dict`
-            for the unit cell at (x, y, z). The :class:`dict` maps
-            the vertices in :attr:`_vertex_prototypes` to the clones
-            for that unit cell.
+        lattice : :class:`dict`
+            Maps ``(x, y, z, vertex_id)`` to the clone of the
+            vertex with id `vertex_id` in :attr:`_vertex_prototypes`,
+            in the (x, y, z) cell of the lattice.
 
         Returns
         -------
@@ -671,37 +683,54 @@ class Cof(TopologyGraph):
 
         """
 
+        lattice_size = np.array(self._lattice_size)
+        # cells[i] is the i-th unit cell, in the same order as
+        # it.product(range(x), range(y), range(z)).
+        cells = np.indices(self._lattice_size).reshape(3, -1).T
+        # periodic_cells[i, j] is the cell in which the second vertex
+        # of edge j is found, when the edge is cloned into cell i.
+        periodic_cells = (
+            cells[:, np.newaxis] + self._edge_prototype_periodicities
+        )
+        # An edge is not periodic if its periodic cell does not have
+        # to wrap around.
+        not_periodic = np.all(
+            (periodic_cells >= 0) & (periodic_cells < lattice_size),
+            axis=2,
+        )
+        not_periodic = not_periodic.ravel().tolist()
+        # Wrap around periodic cells, ie those that are less than 0
+        # or greater than the lattice size along any dimension.
+        periodic_cells %= lattice_size
+        periodic_cells = periodic_cells.reshape(-1, 3).tolist()
+
+        # The parts of each prototype which every clone needs, so
+        # that they are looked up once, rather than once per cell.
+        edge_endpoints = [
+            (
+                edge.get_id(),
+                edge.get_vertex1_id(),
+                edge.get_vertex2_id(),
+                edge.get_periodicity(),
+            )
+            for edge in self._edge_prototypes
+        ]
+
         edge_clones = []
         # Make a clone for each edge for each unit cell.
-        xdim, ydim, zdim = (range(dim) for dim in self._lattice_size)
-        cells = it.product(xdim, ydim, zdim)
-        edges = it.product(cells, self._edge_prototypes)
+        edges = it.product(cells.tolist(), edge_endpoints)
         for id_, (cell, edge) in enumerate(edges):
             x, y, z = cell
-            # The cell in which the second vertex of the edge is found.
-            periodic_cell = np.array(cell) + edge.get_periodicity()
-            # Wrap around periodic cells, ie those that are less than 0
-            # or greater than the lattice size along any dimension.
-            dims = zip(periodic_cell, self._lattice_size)
-            x2, y2, z2 = np.array(
-                [(dim + max_dim) % max_dim for dim, max_dim in dims]
-            )
-            # The edge is not periodic if periodic_cell did not
-            # have to wrap around.
-            dims = zip(periodic_cell, self._lattice_size)
-            edge_is_not_periodic = all(
-                dim >= 0 and dim < max_dim for dim, max_dim in dims
-            )
+            x2, y2, z2 = periodic_cells[id_]
+            parent_id, vertex1_id, vertex2_id, periodicity = edge
             edge_clones.append(
                 CofEdge(
-                    parent_id=edge.get_id(),
+                    parent_id=parent_id,
                     id=id_,
-                    vertex1=lattice[x][y][z][edge.get_vertex1_id()],
-                    vertex2=lattice[x2][y2][z2][edge.get_vertex2_id()],
+                    vertex1=lattice[x, y, z, vertex1_id],
+                    vertex2=lattice[x2, y2, z2, vertex2_id],
                     periodicity=(
-                        (0, 0, 0)
-                        if edge_is_not_periodic
-                        else edge.get_periodicity()
+                        (0, 0, 0) if not_periodic[id_] else periodicity
                     ),
                 )
             )
@@ -713,7 +742,6 @@ class Cof(TopologyGraph):
         cls,
         building_blocks,
         vertices,
-        edges,
     ):
         """
         Map building blocks to the vertices of the graph.
@@ -725,10 +753,8 @@ class Cof(TopologyGraph):
 
         vertices : :class:`iterable` of :class:`.Vertex`
             The vertices which need to have a building block map to
-            them.
-
-        edges : :class:`iterable`of :class:`.Edge`
-            The edges of the graph.
+            them. The id of each vertex must be its index in the
+            lattice, as made by :meth:`_get_lattice`.
 
         Returns
         -------
@@ -767,20 +793,18 @@ class Cof(TopologyGraph):
                 )
             building_blocks_by_degree[num_fgs] = building_block
 
-        vertex_degrees = Counter(
-            vertex_id
-            for edge in edges
-            for vertex_id in edge.get_vertex_ids()
-        )
-
+        # Vertex clones are made cell by cell, in the order of the
+        # prototypes, so the id of each clone gives its prototype.
+        num_prototypes = len(cls._vertex_prototypes)
         building_block_vertices = {}
         for vertex in vertices:
-            vertex_degree = vertex_degrees[vertex.get_id()]
+            vertex_degree = cls._vertex_prototype_degrees[
+                vertex.get_id() % num_prototypes
+            ]
             building_block = building_blocks_by_degree[vertex_degree]
-            building_block_vertices[
-                building_block
-            ] = building_block_vertices.get(building_block, [])
-            building_block_vertices[building_block].append(vertex)
+            building_block_vertices.setdefault(
+                building_block, []
+            ).append(vertex)
         return building_block_vertices
 
     def _get_lattice_constants(self):
@@ -115,10 +115,12 @@ class Kagome(Cof):
 
     """
 
-    _lattice_constants = _a, _b, _c = (
-        np.array([1.0, 0.0, 0.0]),
-        np.array([0.5, 0.866, 0.0]),
-        np.array([0.0, 0.0, 5 / 1.7321]),
+    _lattice_constants = _a, _b, _c = np.array(
+        [
+            [1.0, 0.0, 0.0],
+            [0.5, 0.866, 0.0],
+            [0.0, 0.0, 5 / 1.7321],
+        ]
     )
 
     _non_linears = (
@@ -216,10 +216,12 @@ class PeriodicKagome(Cof):
             optimizer=optimizer,
         )
 
-    _lattice_constants = _a, _b, _c = (
-        np.array([1.0, 0.0, 0.0]),
-        np.array([0.5, 0.866, 0.0]),
-        np.array([0.0, 0.0, 5 / 1.7321]),
+    _lattice_constants = _a, _b, _c = np.array(
+        [
+            [1.0, 0.0, 0.0],
+            [0.5, 0.866, 0.0],
+            [0.0, 0.0, 5 / 1.7321],
+        ]
     )
 
     _non_linears = (
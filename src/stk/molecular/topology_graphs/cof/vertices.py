@@ -5,7 +5,6 @@ COF Vertices
 """
 
 import numpy as np
-from scipy.spatial.distance import euclidean
 
 from stk.utilities import get_acute_vector
 
@@ -61,7 +60,7 @@ class _CofVertex(Vertex):
         return self._aligner_edge
 
     def get_cell(self):
-        return np.array(self._cell)
+        return self._cell.copy()
 
     @classmethod
     def init_at_center(
@@ -101,9 +100,9 @@ class _CofVertex(Vertex):
 
         return cls(
             id=id,
-            position=(
-                sum(vertex.get_position() for vertex in vertices)
-                / len(vertices)
+            position=np.mean(
+                [vertex.get_position() for vertex in vertices],
+                axis=0,
             ),
             aligner_edge=aligner_edge,
             cell=cell,
@@ -136,8 +135,9 @@ class _CofVertex(Vertex):
         cell_shifts : :class:`tuple` of :class:`int`
             The number of cells shifted in the x, y and z directions.
 
-        lattice_constants : :class:`tuple` of :class:`numpy.ndarray`
-            The a, b and c lattice constants.
+        lattice_constants : :class:`numpy.ndarray`
+            The a, b and c lattice constants, as the rows of a
+            ``(3, 3)`` array, or as a :class:`tuple` of three arrays.
 
         aligner_edge : :class:`int`, optional
             The edge which is used to align the :class:`.BuildingBlock`
@@ -156,26 +156,18 @@ class _CofVertex(Vertex):
 
         """
 
-        positions = []
-        for vertex, cell_shift in zip(vertices, cell_shifts):
-            shift = sum(
-                dim_shift * constant
-                for dim_shift, constant in zip(
-                    cell_shift, lattice_constants
-                )
-            )
-            positions.append(vertex.get_position() + shift)
+        # Each row of cell_shifts @ lattice_constants is the shift of
+        # the matching vertex.
+        positions = np.array(
+            [vertex.get_position() for vertex in vertices]
+        ) + np.array(cell_shifts) @ np.asarray(lattice_constants)
 
-        position = np.divide(
-            np.sum(positions, axis=0),
-            len(positions),
-        )
-        return cls(id, position, aligner_edge, cell)
+        return cls(id, positions.mean(axis=0), aligner_edge, cell)
 
     def clone(self):
         clone = super().clone()
         clone._aligner_edge = self._aligner_edge
-        clone._cell = np.array(self._cell)
+        clone._cell = self._cell.copy()
         return clone
 
     def __str__(self):
@@ -231,12 +223,18 @@ class LinearVertex(_CofVertex):
         (fg,) = building_block.get_functional_groups(0)
         fg_position = building_block.get_centroid(fg.get_placer_ids())
 
-        def fg_distance(edge):
-            return euclidean(edge.get_position(), fg_position)
-
-        edges = sorted(edges, key=fg_distance)
+        # Sort the edges by their distance from the functional group,
+        # comparing squared distances, calculated in one pass.
+        displacements = (
+            np.array([edge.get_position() for edge in edges])
+            - fg_position
+        )
+        distances = np.einsum("ij,ij->i", displacements, displacements)
         return {
-            fg_id: edge.get_id() for fg_id, edge in enumerate(edges)
+            fg_id: edges[edge_index].get_id()
+            for fg_id, edge_index in enumerate(
+                np.argsort(distances, kind="stable")
+            )
         }
 
 
@@ -331,9 +329,10 @@ class UnaligningVertex(_CofVertex):
 
         vertex = cls.__new__(cls)
         vertex._id = id
-        vertex._position = sum(
-            vertex.get_position() for vertex in vertices
-        ) / len(vertices)
+        vertex._position = np.mean(
+            [vertex.get_position() for vertex in vertices],
+            axis=0,
+        )
         vertex._cell = np.array(cell)
         vertex._aligner_edge = aligner_edge
         return vertex
@@ -351,20 +350,13 @@ class UnaligningVertex(_CofVertex):
         new_vertex = cls.__new__(cls)
         new_vertex._id = id
 
-        positions = []
-        for vertex, cell_shift in zip(vertices, cell_shifts):
-            shift = sum(
-                dim_shift * constant
-                for dim_shift, constant in zip(
-                    cell_shift, lattice_constants
-                )
-            )
-            positions.append(vertex.get_position() + shift)
+        # Each row of cell_shifts @ lattice_constants is the shift of
+        # the matching vertex.
+        positions = np.array(
+            [vertex.get_position() for vertex in vertices]
+        ) + np.array(cell_shifts) @ np.asarray(lattice_constants)
 
-        new_vertex._position = np.divide(
-            np.sum(positions, axis=0),
-            len(positions),
-        )
+        new_vertex._position = positions.mean(axis=0)
         new_vertex._cell = np.array(cell)
         new_vertex._aligner_edge = aligner_edge
         return new_vertex
@@ -60,8 +60,8 @@ class GuestVertex(Vertex):
 
     def clone(self):
         clone = super().clone()
-        clone._start = np.array(self._start)
-        clone._target = np.array(self._target)
+        clone._start = self._start.copy()
+        clone._target = self._target.copy()
         return clone
 
     def place_building_block(self, building_block, edges):
@@ -4,6 +4,7 @@ Metal Complex Vertices
 
 """
 
+import numpy as np
 from scipy.spatial.distance import euclidean
 
 from stk.utilities import get_projection
@@ -62,9 +63,10 @@ class MonoDentateLigandVertex(Vertex):
         core_centroid = building_block.get_centroid(
             atom_ids=building_block.get_core_atom_ids(),
         )
-        edge_centroid = sum(
-            edge.get_position() for edge in edges
-        ) / len(edges)
+        edge_centroid = np.mean(
+            [edge.get_position() for edge in edges],
+            axis=0,
+        )
         return building_block.with_rotation_between_vectors(
             start=fg_centroid - core_centroid,
             target=edge_centroid - self._position,
@@ -125,9 +127,10 @@ class BiDentateLigandVertex(Vertex):
             target=fg_vector,
         )
 
-        edge_centroid = sum(
-            edge.get_position() for edge in edges
-        ) / len(edges)
+        edge_centroid = np.mean(
+            [edge.get_position() for edge in edges],
+            axis=0,
+        )
         building_block = building_block.with_rotation_between_vectors(
             start=core_to_placer - fg_vector_projection,
             target=edge_centroid - self._position,
@@ -108,9 +108,11 @@ class ConstructionState:
             For each vertex in `vertices`, the building block placed
             on it.
 
-        results : :class:`tuple` of :class:`._PlacementResult`
+        results : :class:`iterable` of :class:`._PlacementResult`
             For every vertex in `vertices`, the result of the
-            placement.
+            placement. This can be a single-pass iterator, such as
+            the one returned by a process pool's ``imap()``, so it
+            is consumed exactly once.
 
         Returns
         -------
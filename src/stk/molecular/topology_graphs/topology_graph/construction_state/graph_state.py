@@ -50,27 +50,24 @@ class _GraphState:
 
         """
 
-        self._vertex_building_blocks = {
-            vertex.get_id(): building_block
-            for building_block, vertices in building_block_vertices.items()
-            for vertex in vertices
-        }
-        self._num_building_blocks = {
-            building_block: len(vertices)
-            for building_block, vertices in building_block_vertices.items()
-        }
-        self._vertices = {
-            vertex.get_id(): vertex
-            for vertices in building_block_vertices.values()
-            for vertex in vertices
-        }
+        # All three maps are filled in a single pass over
+        # building_block_vertices.
+        self._vertex_building_blocks = vertex_building_blocks = {}
+        self._num_building_blocks = num_building_blocks = {}
+        self._vertices = _vertices = {}
+        for (
+            building_block,
+            vertices,
+        ) in building_block_vertices.items():
+            num_building_blocks[building_block] = len(vertices)
+            for vertex in vertices:
+                vertex_id = vertex.get_id()
+                vertex_building_blocks[vertex_id] = building_block
+                _vertices[vertex_id] = vertex
         self._edges = edges
-        self._lattice_constants = tuple(
-            map(
-                np.array,
-                lattice_constants,
-            )
-        )
+        # Held as the rows of a single array, rather than as a tuple
+        # of separate arrays.
+        self._lattice_constants = np.array(lattice_constants)
         self._vertex_edges = self._get_vertex_edges()
 
     def _get_vertex_edges(self):
@@ -138,13 +135,7 @@ class _GraphState:
         end_cell = vertex1.get_cell() + direction * periodicity
         cell_shift = end_cell - vertex2.get_cell()
 
-        shift = sum(
-            axis_shift * constant
-            for axis_shift, constant in zip(
-                cell_shift,
-                self._lattice_constants,
-            )
-        )
+        shift = cell_shift @ self._lattice_constants
         position = (
             vertex2.get_position() + shift + vertex1.get_position()
         ) / 2
@@ -168,12 +159,7 @@ class _GraphState:
         clone._vertices = dict(self._vertices)
         clone._vertex_edges = dict(self._vertex_edges)
         clone._edges = self._edges
-        clone._lattice_constants = tuple(
-            map(
-                np.array,
-                self._lattice_constants,
-            )
-        )
+        clone._lattice_constants = np.array(self._lattice_constants)
         clone._num_building_blocks = dict(self._num_building_blocks)
         return clone
 
@@ -332,12 +318,7 @@ class _GraphState:
 
         """
 
-        self._lattice_constants = tuple(
-            map(
-                np.array,
-                lattice_constants,
-            )
-        )
+        self._lattice_constants = np.array(lattice_constants)
         return self
 
     def with_lattice_constants(self, lattice_constants):
@@ -28,7 +28,7 @@ class _DeletionsSummary:
         "_valid_atom_infos",
         "_valid_bonds",
         "_valid_bond_infos",
-        "_valid_positions",
+        "_valid_position_matrix",
     ]
 
     def __init__(
@@ -73,7 +73,7 @@ class _DeletionsSummary:
         self._atom_infos = tuple(atom_infos)
         self._bonds = tuple(bonds)
         self._bond_infos = tuple(bond_infos)
-        self._position_matrix = np.array(position_matrix)
+        self._position_matrix = np.asarray(position_matrix)
         self._deleted_atom_ids = set(deleted_atom_ids)
         self._deleted_bond_ids = set(deleted_bond_ids)
 
@@ -81,7 +81,6 @@ class _DeletionsSummary:
         self._valid_atom_infos = []
         self._valid_bonds = []
         self._valid_bond_infos = []
-        self._valid_positions = []
         self._with_valid_data()
 
     def _with_valid_data(self):
@@ -105,7 +104,7 @@ class _DeletionsSummary:
 
         valid_atoms = self._valid_atoms
         valid_atom_infos = self._valid_atom_infos
-        valid_positions = self._valid_positions
+        valid_atom_ids = []
         atom_map = {}
 
         def with_atom(atom):
@@ -121,11 +120,14 @@ class _DeletionsSummary:
                     building_block_id=info.get_building_block_id(),
                 )
             )
-            valid_positions.append(position_matrix[atom_id])
+            valid_atom_ids.append(atom_id)
 
         for atom in filter(valid_atom, atoms):
             with_atom(atom)
 
+        # Gathered in one step, rather than row by row.
+        self._valid_position_matrix = position_matrix[valid_atom_ids]
+
         def valid_bond(bond_data):
             index, bond = bond_data
             atom1_id = bond.get_atom1().get_id()
@@ -207,15 +209,15 @@ class _DeletionsSummary:
 
         yield from self._valid_bond_infos
 
-    def get_positions(self):
+    def get_position_matrix(self):
         """
-        Yield the positions of atoms held by the summary.
+        Get the position matrix of the atoms held by the summary.
 
-        Yields
-        ------
+        Returns
+        -------
         :class:`numpy.ndarray`
-            The position of an atom held by the summary.
+            The position matrix of the atoms held by the summary.
 
         """
 
-        yield from self._valid_positions
+        return self._valid_position_matrix
@@ -88,20 +88,20 @@ class _MoleculeState:
         self._atom_infos.extend(summary.get_atom_infos())
         self._bonds.extend(summary.get_bonds())
         self._bond_infos.extend(summary.get_bond_infos())
+        # Concatenated in one step, so that the positions of the
+        # placed building blocks are only copied once.
         self._position_matrix = np.concatenate(
             [
                 self._position_matrix,
-                summary.get_position_matrix(),
+                *summary.get_position_matrices(),
             ]
         )
+        edge_functional_groups = self._edge_functional_groups
         for (
             edge_id,
             functional_groups,
         ) in summary.get_edge_functional_groups():
-            self._edge_functional_groups[
-                edge_id
-            ] = self._edge_functional_groups.get(edge_id, [])
-            self._edge_functional_groups[edge_id].extend(
+            edge_functional_groups.setdefault(edge_id, []).extend(
                 functional_groups
             )
         return self
@@ -129,9 +129,11 @@ class _MoleculeState:
             For each vertex in `vertices`, the building block placed
             on it.
 
-        results : :class:`tuple` of :class:`._PlacementResult`
+        results : :class:`iterable` of :class:`._PlacementResult`
             For every vertex in `vertices`, the result of the
-            placement.
+            placement. This can be a single-pass iterator, such as
+            the one returned by a process pool's ``imap()``, so it
+            is consumed exactly once.
 
         Returns
         -------
@@ -355,5 +357,5 @@ class _MoleculeState:
         self._atom_infos = list(summary.get_atom_infos())
         self._bonds = list(summary.get_bonds())
         self._bond_infos = list(summary.get_bond_infos())
-        self._position_matrix = np.array(list(summary.get_positions()))
+        self._position_matrix = summary.get_position_matrix()
         return self
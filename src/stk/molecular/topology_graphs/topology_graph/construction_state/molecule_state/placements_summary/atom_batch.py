@@ -18,11 +18,12 @@ class _AtomBatch:
 
     """
 
-    __slots__ = ["_atoms", "_atom_infos", "_id_map"]
+    __slots__ = ["_atoms", "_atom_infos", "_id_map", "_atom_map"]
 
     _atoms: tuple[Atom, ...]
     _atom_infos: tuple[AtomInfo, ...]
     _id_map: dict[int, int]
+    _atom_map: dict[int, Atom]
 
     def __init__(
         self,
@@ -53,14 +54,17 @@ class _AtomBatch:
 
         _atoms = []
         atom_infos = []
-        self._id_map = {}
+        self._id_map = id_map = {}
+        self._atom_map = atom_map = {}
 
         for id_, atom in enumerate(atoms, num_atoms):
-            _atoms.append(atom.with_id(id_))
-            self._id_map[atom.get_id()] = _atoms[-1].get_id()
+            new_atom = atom.with_id(id_)
+            _atoms.append(new_atom)
+            id_map[atom.get_id()] = id_
+            atom_map[atom.get_id()] = new_atom
             atom_infos.append(
                 AtomInfo(
-                    atom=_atoms[-1],
+                    atom=new_atom,
                     building_block_atom=atom,
                     building_block=building_block,
                     building_block_id=building_block_id,
@@ -106,3 +110,16 @@ class _AtomBatch:
         """
 
         return dict(self._id_map)
+
+    def get_atom_map(self) -> dict[int, Atom]:
+        """
+        Get a mapping from the old atom id to the new atom.
+
+        Returns:
+
+            Maps the id of an atom provided to the initializer, to
+            the new atom held by the batch, which has an updated id.
+
+        """
+
+        return dict(self._atom_map)
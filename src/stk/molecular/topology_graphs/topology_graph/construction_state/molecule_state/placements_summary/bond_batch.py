@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from typing import Iterable
 
+from ......atoms import Atom
 from ......bonds import Bond, BondInfo
 from ......molecules import BuildingBlock
 
@@ -26,7 +27,7 @@ class _BondBatch:
     def __init__(
         self,
         bonds: Iterable[Bond],
-        id_map: dict[int, int],
+        atom_map: dict[int, Atom],
         building_block: BuildingBlock,
         building_block_id: int,
     ) -> None:
@@ -38,7 +39,7 @@ class _BondBatch:
             bonds:
                 The bonds, which should be added to the batch.
 
-            id_map:
+            atom_map:
                 Maps the ids of atoms held by `bonds`, to the new
                 atoms, which the bonds in the :class:`.BondBatch`
                 instance should hold.
@@ -55,7 +56,9 @@ class _BondBatch:
         self._bond_infos = []
 
         for bond in bonds:
-            self._bonds.append(bond.with_ids(id_map))
+            # Re-use the atoms of the atom batch, rather than giving
+            # every bond its own clones of them.
+            self._bonds.append(bond.with_atoms(atom_map))
             self._bond_infos.append(
                 BondInfo(
                     bond=self._bonds[-1],
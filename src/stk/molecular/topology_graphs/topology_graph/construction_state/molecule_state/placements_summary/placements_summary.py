@@ -63,7 +63,8 @@ class _PlacementsSummary:
 
             placement_results:
                 Holds a :class:`_PlacementResults` instance for each
-                building block in `building_blocks`.
+                building block in `building_blocks`. This can be a
+                single-pass iterator, so it is consumed exactly once.
 
             num_atoms:
                 The number of atoms in molecule being constructed,
@@ -128,7 +129,7 @@ class _PlacementsSummary:
 
         bond_batch = _BondBatch(
             bonds=building_block.get_bonds(),
-            id_map=id_map,
+            atom_map=atom_batch.get_atom_map(),
             building_block=building_block,
             building_block_id=building_block_id,
         )
@@ -262,18 +263,19 @@ class _PlacementsSummary:
 
         yield from self._bond_infos
 
-    def get_position_matrix(self):
+    def get_position_matrices(self):
         """
-        Get a position matrix for the atoms in the summary.
+        Yield the position matrices of the placed building blocks.
 
-        Returns
-        -------
+        Yields
+        ------
         :class:`numpy.ndarray`
-            The position matrix.
+            The position matrix of a placed building block, in the
+            order the atoms were added to the summary.
 
         """
 
-        return np.vstack(self._position_matrices)
+        yield from self._position_matrices
 
     def get_edge_functional_groups(self):
         """
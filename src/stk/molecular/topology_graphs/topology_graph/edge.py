@@ -102,7 +102,7 @@ class Edge:
 
         """
 
-        return any(i != 0 for i in self._periodicity)
+        return any(self._periodicity)
 
     def _with_scale(self, scale):
         """
@@ -150,7 +150,7 @@ class Edge:
         clone._id = self._id
         clone._vertex1_id = self._vertex1_id
         clone._vertex2_id = self._vertex2_id
-        clone._position = np.array(self._position)
+        clone._position = self._position.copy()
         clone._periodicity = self._periodicity
         return clone
 
@@ -208,7 +208,7 @@ class Edge:
 
         """
 
-        return np.array(self._position)
+        return self._position.copy()
 
     def _with_position(self, position):
         """
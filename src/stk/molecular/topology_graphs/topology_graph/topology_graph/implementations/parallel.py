@@ -55,9 +55,13 @@ class _Parallel:
                     edges,
                     building_blocks,
                 )
-                placement_results = pool.map(
+                # Results are streamed in order as workers finish
+                # each chunk, so they are added to the state while
+                # later chunks are still being placed.
+                placement_results = pool.imap(
                     lambda placement: placement.get_result(),
                     placements,
+                    chunksize=self._get_chunksize(len(stage)),
                 )
                 state = state.with_placement_results(
                     vertices=vertices,
@@ -67,6 +71,30 @@ class _Parallel:
                 )
         return state
 
+    def _get_chunksize(self, num_placements: int) -> int:
+        """
+        Get the number of placements sent to a worker at a time.
+
+        This is the same chunk size :meth:`multiprocessing.Pool.map`
+        picks, which gives each process about four chunks per stage.
+
+        Parameters:
+
+            num_placements:
+                The number of placements in the stage.
+
+        Returns:
+
+            The chunk size.
+
+        """
+
+        chunksize, extra = divmod(
+            num_placements,
+            4 * self._num_processes,
+        )
+        return chunksize + 1 if extra else max(chunksize, 1)
+
     def get_num_stages(self) -> int:
         """
         Get the number of placement stages.
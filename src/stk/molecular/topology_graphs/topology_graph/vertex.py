@@ -102,7 +102,8 @@ class Vertex:
 
     def _clone(self: _VertexT) -> _VertexT:
         clone = self.__class__.__new__(self.__class__)
-        Vertex.__init__(clone, self._id, self._position)
+        clone._id = self._id
+        clone._position = self._position.copy()
         return clone
 
     def clone(self) -> Vertex:
@@ -127,7 +128,7 @@ class Vertex:
 
         """
 
-        return np.array(self._position)
+        return self._position.copy()
 
     def _with_position(
         self: _VertexT,
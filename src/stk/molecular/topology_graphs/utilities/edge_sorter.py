@@ -4,6 +4,8 @@ Edge Sorter
 
 """
 
+import numpy as np
+
 from .sorter import _Sorter
 
 
@@ -18,6 +20,7 @@ class _EdgeSorter(_Sorter):
         "_reference",
         "_axis",
         "_edge_centroid",
+        "_edge_positions",
     ]
 
     def __init__(self, edges, aligner_edge, axis):
@@ -38,14 +41,19 @@ class _EdgeSorter(_Sorter):
 
         """
 
-        self._edge_centroid = edge_centroid = sum(
-            edge.get_position() for edge in edges
-        ) / len(edges)
+        edges = tuple(edges)
+        # Fetched once, because each position is used for both the
+        # centroid and the vector of its edge.
+        self._edge_positions = edge_positions = np.array(
+            [edge.get_position() for edge in edges]
+        )
+        edge_centroid = edge_positions.sum(axis=0) / len(edges)
+        self._edge_centroid = edge_centroid
         super().__init__(
             items=edges,
             axis=axis,
             reference=aligner_edge.get_position() - edge_centroid,
         )
 
-    def _get_vector(self, item):
-        return item.get_position() - self._edge_centroid
+    def _get_vectors(self):
+        return self._edge_positions - self._edge_centroid
@@ -22,7 +22,7 @@ class _FunctionalGroupSorter(_Sorter):
         "_reference",
         "_axis",
         "_placer_centroid",
-        "_building_block",
+        "_functional_group_positions",
     ]
 
     def __init__(self, building_block):
@@ -37,17 +37,22 @@ class _FunctionalGroupSorter(_Sorter):
 
         """
 
-        self._building_block = building_block
-        fg0_position = building_block.get_centroid(
-            atom_ids=next(
-                building_block.get_functional_groups()
-            ).get_placer_ids(),
+        # Calculated once, because the position of the first
+        # functional group is needed for both the reference and its
+        # own vector.
+        self._functional_group_positions = fg_positions = np.array(
+            [
+                building_block.get_centroid(
+                    atom_ids=fg.get_placer_ids(),
+                )
+                for fg in building_block.get_functional_groups()
+            ]
         )
-        self._placer_centroid = (
-            placer_centroid
-        ) = building_block.get_centroid(
+        fg0_position = fg_positions[0]
+        placer_centroid = building_block.get_centroid(
             atom_ids=building_block.get_placer_ids(),
         )
+        self._placer_centroid = placer_centroid
         fg0_direction = fg0_position - placer_centroid
         core_centroid = building_block.get_centroid(
             atom_ids=building_block.get_core_atom_ids(),
@@ -66,8 +71,5 @@ class _FunctionalGroupSorter(_Sorter):
             axis=axis,
         )
 
-    def _get_vector(self, item):
-        building_block = self._building_block
-        (fg,) = building_block.get_functional_groups(item)
-        fg_position = building_block.get_centroid(fg.get_placer_ids())
-        return fg_position - self._placer_centroid
+    def _get_vectors(self):
+        return self._functional_group_positions - self._placer_centroid
@@ -6,8 +6,6 @@ Sorter
 
 import numpy as np
 
-from stk.utilities import vector_angle
-
 
 class _Sorter:
     """
@@ -36,7 +34,7 @@ class _Sorter:
 
         """
 
-        self._items = items
+        self._items = tuple(items)
         self._reference = reference
         self._axis = axis
 
@@ -59,28 +57,52 @@ class _Sorter:
 
         raise NotImplementedError()
 
-    def _get_angle(self, item):
+    def _get_vectors(self):
+        """
+        Get the vectors according to which the items should be sorted.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            An ``(n, 3)`` array, holding the vector of each item, in
+            the order of the items.
+
         """
-        Get the angle of `vector` relative to `reference`.
+
+        return np.array(
+            [self._get_vector(item) for item in self._items]
+        )
+
+    def _get_angles(self, vectors):
+        """
+        Get the angles of `vectors` relative to the reference.
 
         Parameters
         ----------
-        item : :class:`object`
-            The item being sorted.
+        vectors : :class:`numpy.ndarray`
+            An ``(n, 3)`` array, each row of which holds the vector of
+            an item being sorted.
 
         Returns
         -------
-        :class:`float`
-            The angle between `item` and the reference vector.
+        :class:`numpy.ndarray`
+            For each row of `vectors`, the angle between it and the
+            reference vector, going clockwise.
 
         """
 
-        vector = self._get_vector(item)
-        theta = vector_angle(self._reference, vector)
-        projection = vector @ self._axis
-        if theta > 0 and projection < 0:
-            return 2 * np.pi - theta
-        return theta
+        # Unlike the arccos of the cosine, the arctan2 of the sine and
+        # cosine is accurate near 0 and pi, and needs no clipping.
+        theta = np.arctan2(
+            np.linalg.norm(np.cross(self._reference, vectors), axis=1),
+            vectors @ self._reference,
+        )
+        projections = vectors @ self._axis
+        return np.where(
+            (theta > 0) & (projections < 0),
+            2 * np.pi - theta,
+            theta,
+        )
 
     def get_items(self):
         """
@@ -93,7 +115,9 @@ class _Sorter:
 
         """
 
-        yield from sorted(self._items, key=self._get_angle)
+        angles = self._get_angles(self._get_vectors())
+        for index in np.argsort(angles, kind="stable"):
+            yield self._items[index]
 
     def get_axis(self):
         """
@@ -327,16 +327,18 @@ def archive_output():
 
     """
 
-    if "output" not in os.listdir():
+    if not os.path.exists("output"):
         return
 
     # Make the ``stk_ea_runs`` folder if it does not exist already.
-    if "stk_ea_runs" not in os.listdir():
+    if not os.path.exists("stk_ea_runs"):
         os.mkdir("stk_ea_runs")
 
     # Find out with what number the ``output`` folder should be
-    # labelled within ``stk_ea_runs``.
-    num = len(os.listdir("stk_ea_runs"))
+    # labelled within ``stk_ea_runs``. The entries are counted as
+    # they are scanned, rather than collected into a list first.
+    with os.scandir("stk_ea_runs") as entries:
+        num = sum(1 for _ in entries)
     new_dir = os.path.join("stk_ea_runs", str(num))
     os.rename("output", new_dir)
 
@@ -1018,9 +1020,9 @@ def vector_angle(vector1, vector2):
 
 def get_acute_vector(reference, vector):
     if (
-        # vector_angle is NaN if reference is [0, 0, 0].
+        # A reference of [0, 0, 0] has no direction to compare with.
         not np.allclose(reference, [0, 0, 0], atol=1e-5)
-        and vector_angle(vector, reference) > np.pi / 2
+        and np.dot(vector, reference) < 0
     ):
         return vector * -1
     return vector
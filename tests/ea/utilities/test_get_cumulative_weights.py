@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+
+import stk
+from stk.ea.utilities import _get_cumulative_weights
+
+
+class _Operation:
+    """
+    A stand-in mutator and crosser, which returns itself when used.
+
+    """
+
+    def mutate(self, record):
+        return self
+
+    def cross(self, records):
+        return self
+
+
+@pytest.fixture(
+    params=(
+        (0.5, 0.5, 5.0),
+        (1.0,),
+        (-1.0, 2.0),
+        (0.0, 0.0),
+        (0.5, 0.6),
+    ),
+)
+def invalid_weights(request):
+    """
+    Weights for two items, which should be rejected.
+
+    """
+
+    return request.param
+
+
+@pytest.fixture(
+    params=(
+        None,
+        (0.2, 0.3, 0.5),
+        (0.0, 0.75, 0.25),
+    ),
+)
+def weights(request):
+    """
+    Valid weights for three items.
+
+    """
+
+    return request.param
+
+
+@pytest.fixture(
+    params=(
+        lambda operations, weights, random_seed: stk.RandomMutator(
+            mutators=operations,
+            weights=weights,
+            random_seed=random_seed,
+        ).mutate,
+        lambda operations, weights, random_seed: stk.RandomCrosser(
+            crossers=operations,
+            weights=weights,
+            random_seed=random_seed,
+        ).cross,
+    ),
+)
+def get_operation(request):
+    """
+    Get the :meth:`mutate` or :meth:`cross` method of a compound.
+
+    The returned function takes the operations to pick from, their
+    `weights` and a `random_seed`, and returns the bound method
+    of a :class:`.RandomMutator` or :class:`.RandomCrosser`.
+
+    """
+
+    return request.param
+
+
+def test_invalid_weights(invalid_weights):
+    """
+    Test that :func:`._get_cumulative_weights` rejects bad weights.
+
+    Parameters
+    ----------
+    invalid_weights : :class:`tuple` of :class:`float`
+        Weights for two items, which should be rejected.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    with pytest.raises(ValueError):
+        _get_cumulative_weights(invalid_weights, 2)
+
+
+def test_seeded_selection(get_operation, weights):
+    """
+    Test that a random seed picks the same sequence as before.
+
+    The compound operations used to pick with
+    :meth:`numpy.random.RandomState.choice`, so for a given random
+    seed, the sequence of picks must be the same as the one it
+    gives.
+
+    Parameters
+    ----------
+    get_operation : :class:`callable`
+        Gets the :meth:`mutate` or :meth:`cross` method to test.
+
+    weights : :class:`tuple` of :class:`float`
+        The weights of the operations. Can be ``None``.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    operations = (_Operation(), _Operation(), _Operation())
+    random_seed = 4
+    operation = get_operation(operations, weights, random_seed)
+    generator = np.random.RandomState(random_seed)
+    for _ in range(100):
+        expected = generator.choice(a=operations, p=weights)
+        assert operation(None) is expected
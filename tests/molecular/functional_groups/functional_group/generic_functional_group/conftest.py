@@ -0,0 +1,64 @@
+import pytest
+
+
+def _get_unchanged(functional_group):
+    return functional_group, {}
+
+
+def _get_clone(functional_group):
+    return functional_group.clone(), {}
+
+
+def _get_id_map(functional_group, num_atoms):
+    # Make sure the new ids are always valid, by making them larger
+    # than the biggest one in the functional group.
+    new_id = max(functional_group.get_atom_ids()) + 1
+    atom_ids = tuple(functional_group.get_atom_ids())[:num_atoms]
+    return {
+        atom_id: new_id + index
+        for index, atom_id in enumerate(atom_ids)
+    }
+
+
+def _get_with_ids_one(functional_group):
+    id_map = _get_id_map(functional_group, 1)
+    return functional_group.with_ids(id_map), id_map
+
+
+def _get_with_ids_all(functional_group):
+    id_map = _get_id_map(functional_group, None)
+    return functional_group.with_ids(id_map), id_map
+
+
+def _get_with_atoms(functional_group):
+    id_map = _get_id_map(functional_group, None)
+    atom_map = {
+        atom.get_id(): atom.with_id(id_map[atom.get_id()])
+        for atom in functional_group.get_atoms()
+    }
+    return functional_group.with_atoms(atom_map), id_map
+
+
+@pytest.fixture(
+    params=(
+        _get_unchanged,
+        _get_clone,
+        _get_with_ids_one,
+        _get_with_ids_all,
+        _get_with_atoms,
+    ),
+)
+def get_derived_functional_group(request):
+    """
+    A function which derives a functional group to test.
+
+    The function takes a single parameter, the
+    :class:`.GenericFunctionalGroup` of a test case, and returns a
+    :class:`tuple`. The first element is the derived functional
+    group, for example a clone or a copy with changed atom ids. The
+    second element is a :class:`dict`, which maps the original id of
+    each changed atom to its new id.
+
+    """
+
+    return request.param
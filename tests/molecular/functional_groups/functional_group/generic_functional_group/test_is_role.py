@@ -0,0 +1,88 @@
+import pytest
+
+
+@pytest.fixture(
+    params=(
+        ("is_bonder", "bonders"),
+        ("is_deleter", "deleters"),
+    ),
+)
+def role(request):
+    """
+    The name of a role method and the matching case data attribute.
+
+    """
+
+    return request.param
+
+
+def test_is_role(
+    generic_case_data, get_derived_functional_group, role
+):
+    """
+    Test :meth:`.GenericFunctionalGroup.is_bonder` and similar.
+
+    Parameters
+    ----------
+    generic_case_data : :class:`.GenericCaseData`
+        The test case. Holds the functional group to test and the
+        correct bonder and deleter atoms.
+
+    get_derived_functional_group : :class:`callable`
+        Derives the functional group which is tested from the one
+        in `generic_case_data`, for example by cloning it or by
+        changing its atom ids.
+
+    role : :class:`tuple` of :class:`str`
+        The name of the method to test, such as ``"is_bonder"``, and
+        the name of the `generic_case_data` attribute holding the
+        atoms for which it should return ``True``.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    method_name, atoms_name = role
+    functional_group, id_map = get_derived_functional_group(
+        generic_case_data.functional_group,
+    )
+    atom_ids = set(
+        atom.get_id() for atom in generic_case_data.atoms
+    ).union(id_map.values())
+    _test_is_role(
+        is_role=getattr(functional_group, method_name),
+        atom_ids=atom_ids,
+        role_ids=set(
+            id_map.get(atom.get_id(), atom.get_id())
+            for atom in getattr(generic_case_data, atoms_name)
+        ),
+    )
+
+
+def _test_is_role(is_role, atom_ids, role_ids):
+    """
+    Test a method such as :meth:`.GenericFunctionalGroup.is_bonder`.
+
+    Parameters
+    ----------
+    is_role : :class:`callable`
+        The method to test. Takes an atom id and returns ``True`` if
+        the atom has the role.
+
+    atom_ids : :class:`set` of :class:`int`
+        The ids to check, which include ids the functional group
+        held before any of its atoms were changed.
+
+    role_ids : :class:`set` of :class:`int`
+        The correct ids of the atoms which have the role.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    for atom_id in atom_ids:
+        assert is_role(atom_id) == (atom_id in role_ids)
@@ -97,3 +97,27 @@ def is_modified_id_sequence(
             assert modified_id == id_map[original_id]
         else:
             assert original_id == modified_id
+
+
+def test_with_ids_of_atoms_outside_atoms() -> None:
+    """
+    Test :meth:`.GenericFunctionalGroup.with_ids` on other roles.
+
+    The initializer does not require bonders, deleters and placers to
+    be among the atoms of the functional group, so they must be
+    remapped even if none of the atoms is.
+
+    """
+
+    functional_group = stk.GenericFunctionalGroup(
+        atoms=(stk.C(0),),
+        bonders=(stk.N(5),),
+        deleters=(stk.O(6),),
+        placers=(stk.S(7),),
+    )
+    clone = functional_group.with_ids({5: 9, 6: 10, 7: 11})
+
+    assert tuple(clone.get_atom_ids()) == (0,)
+    assert tuple(clone.get_bonder_ids()) == (9,)
+    assert tuple(clone.get_deleter_ids()) == (10,)
+    assert tuple(clone.get_placer_ids()) == (11,)